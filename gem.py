@@ -84,6 +84,10 @@ Environment Variables:
     GEM_CHANGE_THRESHOLD    - Scene change threshold 0.0-1.0 (default: 0.15)
     GEM_MIN_INTERVAL        - Min seconds between analyses (default: 5)
     GEM_FORCE_INTERVAL      - Force analysis interval in seconds (default: 30)
+    GEM_RT_PRIORITY         - Run the daemon SCHED_RR at this priority and lock
+                              its memory (default: 0 = off; needs root/CAP_SYS_NICE)
+    GEM_FORCE_API_CHECK     - `gem.py test` always calls Gemini instead of trusting
+                              a pass from the last 10 minutes (default: false)
 
     # TTS and Announcement Settings
     GEM_TTS_ENABLED         - Enable spoken audio feedback globally (default: false)
@@ -164,6 +168,7 @@ Environment Variables:
 # These are built into Python and always available
 # -----------------------------------------------------------------------------
 import re           # Regular expressions for local query classification
+import json         # Strict JSON for files we write ourselves (fast C parser)
 import os           # Environment variables, file paths
 import sys          # System-specific parameters, exit codes
 import io           # In-memory binary streams (for JPEG buffers)
@@ -171,18 +176,34 @@ import time         # Timestamps, sleep, performance timing
 import math         # Mathematical functions (exponential decay)
 import random       # Jitter for exponential backoff retry
 import select       # Non-blocking I/O for voice+keyboard input
+import fcntl        # flock on the access journal shared by daemon and search
 import tempfile     # Atomic file writes (crash-safe persistence)
+import mmap         # Paging memory JPEGs in on demand instead of holding bytes
 import subprocess   # Execute external commands (arecord for audio)
-from datetime import datetime, timedelta  # Human-readable timestamps + time math
+import wave         # WAV header parsing for in-process ALSA playback
+import struct       # WAV header packing for in-process ALSA capture
+import contextlib   # nullcontext when analyze_and_store runs without a lock
+import threading    # Background feeders for audio playback pipes, persist thread
+import queue        # Bounded hand-off to the background persist thread
+import functools    # lru_cache for small pure helpers
+import hashlib      # API key fingerprint for the cached hardware-test API check
+import heapq        # Merging sorted posting lists newest-first
+from bisect import bisect_left, bisect_right  # Sorted posting lists + timeline
+from datetime import date, datetime, timedelta  # Human-readable timestamps + time math
 from pathlib import Path           # Modern file path handling
-from dataclasses import dataclass, field  # Clean data class definitions
+from dataclasses import dataclass, field, asdict  # Clean data class definitions
+from collections import OrderedDict  # LRU caches for repeated queries
+from collections.abc import Callable, Iterator  # Type hints for dispatch tables, streams
+from concurrent.futures import ThreadPoolExecutor  # Parallel memory file reads
+from itertools import chain, islice  # Batching/slicing lazy streams without copies
+from textwrap import shorten        # Word-boundary truncation for LCD/TTS text
 
 # -----------------------------------------------------------------------------
 # Third-Party Imports
 # Install with: pip install google-genai json5
 # On Pi: uses system pillow/numpy from apt (python3-pil, python3-numpy)
 # -----------------------------------------------------------------------------
-import json5                       # JSON parser (superset of json, handles malformed LLM output)
+import json5                       # Lenient parser for LLM output + legacy files (ours are strict JSON)
 import numpy as np                 # Numerical operations for frame comparison
 from PIL import Image, ImageDraw, ImageFont  # Image processing and annotation
 
@@ -217,6 +238,51 @@ except ImportError:
     # HAT not connected or driver not installed
     WHISPLAY_AVAILABLE = False
 
+# -----------------------------------------------------------------------------
+# Optional Performance Imports
+# Pure speedups - a slower built-in fallback is used when they're missing
+# -----------------------------------------------------------------------------
+
+# Aho-Corasick automaton - requires: pip install pyahocorasick
+# Scans a string for many keywords in one pass (used for object contexts)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+
+except ImportError:
+    # Fall back to a compiled regex alternation
+    AHOCORASICK_AVAILABLE = False
+
+# Numba JIT compiler - requires: pip install numba
+# Compiles the per-frame bounding box loop to machine code
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+
+except ImportError:
+    # Fall back to NumPy vector ops
+    NUMBA_AVAILABLE = False
+
+# orjson - requires: pip install orjson
+# Faster parsing of the per-memory JSON files (gem.py list, index rebuild)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+except ImportError:
+    # Fall back to the stdlib json C parser
+    ORJSON_AVAILABLE = False
+
+# ALSA bindings - requires: pip install pyalsaaudio
+# Plays WAV clips in-process instead of forking aplay for each one
+try:
+    import alsaaudio
+    ALSAAUDIO_AVAILABLE = True
+
+except ImportError:
+    # Fall back to piping into aplay
+    ALSAAUDIO_AVAILABLE = False
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECTION 2: CONFIGURATION
@@ -269,6 +335,15 @@ DATA_DIR = GEM_ROOT / "data"
 MAX_MEMORIES = int(os.getenv("GEM_MAX_MEMORIES", "1000"))
 # Maximum memories before cleanup (prevents disk from filling up)
 
+LLM_CACHE_TTL = int(os.getenv("GEM_LLM_CACHE_TTL", "3600"))
+# Seconds to reuse a saved Gemini location suggestion / activity summary
+# (data/llm_cache.json, survives restarts). 0 disables the cache.
+
+API_CHECK_TTL = 600
+FORCE_API_CHECK = os.getenv("GEM_FORCE_API_CHECK", "false").lower() in ("1", "true")
+# `gem.py test` skips its Gemini round-trip if the same model + API key passed
+# within API_CHECK_TTL seconds (data/api_check_ok). GEM_FORCE_API_CHECK=1 always calls.
+
 # -----------------------------------------------------------------------------
 # Capture Behavior Configuration
 # -----------------------------------------------------------------------------
@@ -305,6 +380,11 @@ PIXEL_CHANGE_THRESHOLD = 30
 # A pixel is "changed" if its intensity differs by more than this amount
 # Helps ignore noise and minor lighting changes
 
+RT_PRIORITY = int(os.getenv("GEM_RT_PRIORITY", "0"))
+# Real-time priority for the capture daemon (SCHED_RR, 1-99; 0 = normal scheduling)
+# Keeps background I/O from preempting the camera/mic loop on a busy Pi.
+# Stay mid-range (20-50): near 99 it can starve kernel threads.
+
 # -----------------------------------------------------------------------------
 # Hardware Configuration
 # -----------------------------------------------------------------------------
@@ -331,9 +411,13 @@ ANNOUNCE_ENABLED = os.getenv("GEM_ANNOUNCE_ENABLED", "false").lower() == "true"
 # Helps prevent forgetting where you just put something
 # Disabled by default (requires TTS_ENABLED=true)
 
-ANNOUNCE_OBJECTS = set(os.getenv("GEM_ANNOUNCE_OBJECTS",
-    "phone,keys,wallet,glasses,remote,headphones,watch").split(","))
+ANNOUNCE_OBJECTS = frozenset(
+    name.strip().lower()
+    for name in os.getenv("GEM_ANNOUNCE_OBJECTS",
+                          "phone,keys,wallet,glasses,remote,headphones,watch").split(",")
+    if name.strip())
 # Which objects to announce when placed (important items only)
+# Lowercased frozenset: O(1) membership test against lowercased object names
 
 ANNOUNCE_COOLDOWN = int(os.getenv("GEM_ANNOUNCE_COOLDOWN", "60"))
 # Seconds between announcements for the same object (prevent spam)
@@ -381,6 +465,8 @@ MEDGEMMA_MODEL = os.getenv("GEM_MEDGEMMA_MODEL", "medgemma-1.5")
 
 HAT_LCD_WIDTH = 240   # Whisplay HAT LCD width in pixels
 HAT_LCD_HEIGHT = 280  # Whisplay HAT LCD height in pixels
+BUTTON_POLL_INTERVAL = 0.05  # Seconds between HAT button samples (watcher thread)
+BUTTON_EDGE_TIMEOUT_MS = 1000  # Max block on a button GPIO edge before re-checking for cleanup
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -445,6 +531,111 @@ def atomic_write_bytes(path: Path, data: bytes):
         raise
 
 
+# Files at least this big are parsed straight from an mmap (orjson only)
+_JSON_MMAP_MIN_BYTES = 64 * 1024
+
+
+def read_json(path: Path):
+    """
+    Parse a JSON file we wrote ourselves, falling back to json5.
+
+    Memory metadata and the temporal graph are written as strict JSON, so
+    the C parser (orjson, else stdlib json) handles them without json5's
+    pure-Python tokenizer. Large files (the temporal graph grows for as
+    long as the agent runs) are memory-mapped and handed to orjson as a
+    memoryview, skipping the read() copy. Older files were written by
+    json5.dumps (unquoted keys) and hand-edited files may not be strict
+    either; those still parse via json5.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed object
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If it isn't valid JSON5 either
+    """
+    with open(path, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= _JSON_MMAP_MIN_BYTES:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            except ValueError:
+                pass  # Not strict JSON: json5 below
+        raw = f.read()
+    try:
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except ValueError:  # orjson.JSONDecodeError is a ValueError too
+        return json5.loads(raw.decode("utf-8"))
+
+
+def read_json_or_none(path: Path):
+    """read_json() that returns None for a missing or unparseable file."""
+    try:
+        return read_json(path)
+    except Exception:
+        return None
+
+
+def epoch_ns(epoch: float) -> int:
+    """
+    Convert Unix seconds (float) to integer nanoseconds.
+
+    Rounded through whole microseconds, so any timestamp with microsecond
+    resolution (all of ours) maps to the same int every time.
+
+    Args:
+        epoch: Seconds since the epoch, e.g. datetime.timestamp()
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    return round(epoch * 1_000_000) * 1000
+
+
+def mtime_ns(path: Path) -> int:
+    """
+    Get modification time of a file or directory in nanoseconds.
+
+    Used to skip re-reading files that haven't changed. All our writes go
+    through atomic_write_* (temp file + rename), so every write gives the
+    file - and its directory - a fresh mtime.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        st_mtime_ns, or 0 if the path doesn't exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _truncate(text: str, width: int) -> str:
+    """
+    Shorten text to at most width characters, breaking at a word boundary.
+
+    textwrap.shorten() alone returns just the "..." placeholder when the
+    first word is already too long (an unspaced query, a URL); fall back
+    to a hard cut there so the LCD/TTS never shows an empty "...".
+
+    Args:
+        text: Text to shorten (whitespace runs are collapsed)
+        width: Maximum length including the "..." suffix
+
+    Returns:
+        text unchanged if it fits, else a truncated copy ending in "..."
+    """
+    short = shorten(text, width, placeholder="...")
+    if short == "..." and text.strip():
+        return " ".join(text.split())[:width - 3] + "..."
+    return short
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECTION 3B: LOGGING UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -453,6 +644,11 @@ def atomic_write_bytes(path: Path, data: bytes):
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Banner rules for the CLI headers (60 wide for daemon/search/list,
+# 50 for the hardware test)
+_BANNER60 = "=" * 60
+_BANNER50 = "=" * 50
+
 def log(msg: str):
     """
     Print timestamped log message to stdout.
@@ -487,6 +683,21 @@ def log_error(msg: str):
     print(f"[{ts}] ❌ {msg}", file=sys.stderr)
 
 
+def log_banner(*lines: str, rule: str = _BANNER60):
+    """
+    Log a header block: rule, each line, rule - in a single print.
+
+    Every line keeps the usual [HH:MM:SS] prefix, so the output matches
+    the equivalent run of log() calls.
+
+    Args:
+        *lines: Header lines (indent them yourself, e.g. "  GEM Search")
+        rule: Rule line above and below (_BANNER60 or _BANNER50)
+    """
+    ts = datetime.now().strftime('%H:%M:%S')
+    print("\n".join(f"[{ts}] {line}" for line in (rule, *lines, rule)))
+
+
 def human_time(iso_timestamp: str) -> str:
     """
     Convert ISO timestamp to human-friendly format for people with memory issues.
@@ -733,6 +944,11 @@ class ObjectMovement:
         )
 
 
+# Lengths of datetime.isoformat() output for naive timestamps, with and
+# without microseconds. Strings of these lengths compare chronologically.
+_NAIVE_ISO_LENGTHS = (19, 26)
+
+
 class TemporalGraph:
     """
     In-memory graph tracking object movements over time.
@@ -794,6 +1010,9 @@ class TemporalGraph:
         # Statistics for monitoring
         self.total_movements = 0
         self.start_time = datetime.now().isoformat()
+
+        # mtime of the file last passed to load() (see load_if_changed)
+        self._loaded_mtime_ns = 0
     
     def update(self, obj_name: str, location: str, position: str,
                timestamp: str, memory_id: str) -> ObjectMovement | None:
@@ -990,7 +1209,7 @@ class TemporalGraph:
         obj_name = obj_name.lower()
         self.attached_objects[obj_name] = (timestamp, location)
 
-    def check_removed_attached(self, current_objects: list[str],
+    def check_removed_attached(self, current_objects: set[str] | frozenset[str],
                                 current_time: str,
                                 timeout_seconds: int = 30) -> list[str]:
         """
@@ -1000,7 +1219,8 @@ class TemporalGraph:
         seen it for timeout_seconds, it was likely removed and placed somewhere.
 
         Args:
-            current_objects: List of object names currently visible (attached or not)
+            current_objects: Set of lowercased object names currently visible
+                             (attached or not)
             current_time: Current timestamp (ISO format)
             timeout_seconds: How long before we consider object removed
 
@@ -1008,19 +1228,27 @@ class TemporalGraph:
             List of object names that were removed (no longer attached)
         """
         removed = []
-        current_set = {o.lower() for o in current_objects}
         current_dt = datetime.fromisoformat(current_time.replace('Z', '+00:00'))
 
-        for obj_name, (last_time, last_loc) in list(self.attached_objects.items()):
-            # Skip if we still see this object
-            if obj_name in current_set:
-                continue
+        # Timestamps we write ourselves are naive local ISO-8601
+        # ("YYYY-MM-DDTHH:MM:SS[.ffffff]"), which sort correctly as plain
+        # strings. Compare those against a cutoff string instead of parsing
+        # each one; anything else (e.g. a 'Z' suffix) still gets parsed.
+        cutoff = (current_dt - timedelta(seconds=timeout_seconds)).isoformat()
+        naive_now = current_dt.tzinfo is None
+
+        # Only attached objects we can no longer see (set difference)
+        for obj_name in self.attached_objects.keys() - current_objects:
+            last_time, last_loc = self.attached_objects[obj_name]
 
             # Check if enough time has passed
             try:
-                last_dt = datetime.fromisoformat(last_time.replace('Z', '+00:00'))
-                elapsed = (current_dt - last_dt).total_seconds()
-                if elapsed >= timeout_seconds:
+                if naive_now and len(last_time) in _NAIVE_ISO_LENGTHS:
+                    expired = last_time <= cutoff
+                else:
+                    last_dt = datetime.fromisoformat(last_time.replace('Z', '+00:00'))
+                    expired = (current_dt - last_dt).total_seconds() >= timeout_seconds
+                if expired:
                     removed.append(obj_name)
                     # Remove from attached tracking
                     del self.attached_objects[obj_name]
@@ -1051,6 +1279,18 @@ class TemporalGraph:
         Args:
             path: Path to save JSON file
         """
+        self.write_snapshot(path, self.snapshot())
+
+    def snapshot(self) -> tuple[str, str]:
+        """
+        Serialize the graph for write_snapshot(), without writing it.
+
+        Lets the daemon's persist thread copy the graph under persist_lock
+        and do the fsync'd writes after releasing it.
+
+        Returns:
+            (graph JSON, summary sidecar JSON)
+        """
         data = {
             "start_time": self.start_time,
             "total_movements": self.total_movements,
@@ -1061,7 +1301,70 @@ class TemporalGraph:
             },
             "attached_objects": {k: list(v) for k, v in self.attached_objects.items()}
         }
-        atomic_write_text(path, json5.dumps(data, indent=2))
+        # Strict JSON (json5.dumps leaves keys unquoted) so read_json's fast path applies
+        return json.dumps(data, indent=2), json.dumps(self.summary())
+
+    @classmethod
+    def write_snapshot(cls, path: Path, snapshot: tuple[str, str]):
+        """
+        Write a snapshot() to path and its summary sidecar.
+
+        Args:
+            path: Path to save JSON file
+            snapshot: Output of snapshot()
+        """
+        graph_text, summary_text = snapshot
+        atomic_write_text(path, graph_text)
+        # Small sidecar so `gem.py list` needn't parse the whole graph.
+        # Written after the graph, so a newer graph means a stale summary.
+        atomic_write_text(cls.summary_path(path), summary_text)
+
+    def summary(self, top_k: int = 5) -> dict:
+        """
+        Aggregate counters shown by `gem.py list`.
+
+        Args:
+            top_k: Number of most-moved objects to include
+
+        Returns:
+            {"total_movements", "n_objects", "top": [[name, n_movements], ...]}
+        """
+        # Heap selection: O(N log k) over every object ever tracked
+        most_active = heapq.nlargest(top_k, self.movements.items(), key=lambda x: len(x[1]))
+        return {
+            "total_movements": self.total_movements,
+            "n_objects": len(self.last_seen),
+            "top": [[name, len(moves)] for name, moves in most_active],
+        }
+
+    @staticmethod
+    def summary_path(path: Path) -> Path:
+        """Sidecar summary file written next to the graph JSON at path."""
+        return path.with_name("temporal_summary.json")
+
+    @classmethod
+    def load_summary(cls, path: Path) -> dict:
+        """
+        summary() of the graph saved at path, without loading the graph.
+
+        Reads the sidecar written by save(). Falls back to a full load()
+        when the sidecar is missing (graph saved by an older version) or
+        older than the graph (interrupted between the two writes).
+
+        Args:
+            path: Path to the graph JSON file
+
+        Returns:
+            Same dict as summary()
+        """
+        sidecar = cls.summary_path(path)
+        if mtime_ns(sidecar) >= mtime_ns(path):
+            summary = read_json_or_none(sidecar)
+            if summary is not None:
+                return summary
+        graph = cls()
+        graph.load(path)
+        return graph.summary()
 
     def load(self, path: Path):
         """
@@ -1072,11 +1375,14 @@ class TemporalGraph:
         Args:
             path: Path to JSON file
         """
-        if not path.exists():
+        # Stat before reading: a write that lands mid-read gets picked up
+        # by the next load_if_changed() instead of being missed
+        self._loaded_mtime_ns = mtime_ns(path)
+        if not self._loaded_mtime_ns:
             return
         
         try:
-            data = json5.loads(path.read_text())
+            data = read_json(path)
             self.start_time = data.get("start_time", self.start_time)
             self.total_movements = data.get("total_movements", 0)
             
@@ -1098,6 +1404,25 @@ class TemporalGraph:
         except Exception as e:
             log_error(f"Failed to load temporal graph: {e}")
 
+    def load_if_changed(self, path: Path) -> bool:
+        """
+        Reload from disk only if the file changed since the last load().
+
+        Search mode re-reads the graph before every query to see the
+        daemon's latest movements; this turns the common no-change case
+        into a single stat() instead of a full JSON parse.
+
+        Args:
+            path: Path to JSON file (same one given to load())
+
+        Returns:
+            True if the graph was reloaded
+        """
+        if mtime_ns(path) == self._loaded_mtime_ns:
+            return False
+        self.load(path)
+        return True
+
 
 @dataclass
 class Memory:
@@ -1125,7 +1450,8 @@ class Memory:
         objects: List of detected objects with bounding boxes
         activities: List of detected activities (e.g., "taking medication")
         image_path: Path to saved JPEG file
-        image_data: Raw JPEG bytes (for display without disk read)
+        image_data: Raw JPEG bytes, only set for a freshly captured memory;
+            memories loaded from disk page the JPEG in via image_buffer()
     """
     id: str                  # Unique ID: "mem_YYYYMMDD_HHMMSS"
     timestamp: str           # ISO format: "2026-01-22T14:30:00"
@@ -1134,7 +1460,7 @@ class Memory:
     objects: list[BoundingBox] = field(default_factory=list)
     activities: list[str] = field(default_factory=list)        # Detected activities: ["taking medication"]
     image_path: str = ""     # Path to saved JPEG
-    image_data: bytes = b""  # Raw JPEG bytes (for display)
+    image_data: bytes = b""  # Raw JPEG bytes (fresh captures only, see image_buffer)
     tags: list[str] = field(default_factory=list)              # Scene tags: ["kitchen", "cooking"]
     relationships: list[str] = field(default_factory=list)     # Spatial: ["keys on desk"]
     # Audio/Conversation episodic memory (WHO dimension)
@@ -1143,6 +1469,8 @@ class Memory:
     conversation_context: str = ""                              # Summary of what was discussed
     # Visual person detection (WHO dimension - visual)
     persons: list[dict] = field(default_factory=list)          # Visual persons: [{"description": "man in blue shirt", "context": "sitting at desk"}]
+    # Cached one-line prompt summary (see summary_line)
+    _summary_line: str | None = field(default=None, init=False, repr=False, compare=False)
     
     def find_object(self, name: str) -> BoundingBox | None:
         """
@@ -1178,6 +1506,240 @@ class Memory:
         """
         return [obj.name for obj in self.objects]
 
+    def image_buffer(self) -> bytes | mmap.mmap:
+        """
+        JPEG bytes for display/VQA, without keeping them resident.
+
+        A freshly captured memory still carries its bytes in image_data.
+        Memories loaded from disk don't: the JPEG is memory-mapped read-only
+        here, so the page cache holds the pixels and the memory LRU only
+        holds metadata. The map is closed when the caller drops it.
+
+        Returns:
+            image_data, an mmap of image_path, or b"" if there is no image
+        """
+        if self.image_data:
+            return self.image_data
+        if not self.image_path:
+            return b""
+        try:
+            with open(self.image_path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Missing file / empty file can't be mapped
+            return b""
+
+    def image_bytes(self) -> bytes:
+        """
+        JPEG as a bytes object, for callers that must hand over real bytes
+        (e.g. the Gemini upload). One read() of the file; mapping it with
+        image_buffer() and then copying it out would touch every page twice.
+
+        Returns:
+            image_data, the contents of image_path, or b"" if there is no image
+        """
+        if self.image_data:
+            return self.image_data
+        if not self.image_path:
+            return b""
+        try:
+            return Path(self.image_path).read_bytes()
+        except OSError:
+            return b""
+
+    def image_size(self) -> int:
+        """Size of the JPEG in bytes, from image_data or a stat() of image_path."""
+        if self.image_data:
+            return len(self.image_data)
+        try:
+            return os.stat(self.image_path).st_size if self.image_path else 0
+        except OSError:
+            return 0
+
+    def summary_line(self) -> str:
+        """
+        One-line summary used when building narrative prompts.
+
+        Computed on first call and cached, so re-summarizing the same
+        memories (e.g. repeated "what did I do this morning?") only
+        concatenates strings.
+
+        Returns:
+            Line like "- 14:30 at kitchen counter: keys, wallet"
+        """
+        if self._summary_line is None:
+            time_str = self.timestamp[11:16] if len(self.timestamp) > 16 else self.timestamp
+            objs = ", ".join(self.object_names()[:4]) or "no objects"
+            self._summary_line = f"- {time_str} at {self.location}: {objs}"
+        return self._summary_line
+
+
+# Object contexts meaning "the user was holding it", not "it was put down".
+# Matched in a single pass over the context string: an Aho-Corasick
+# automaton when pyahocorasick is installed, else one regex alternation.
+_IN_HAND_HINTS = ("in hand", "held", "holding", "carrying", "gripping")
+_IN_HAND_RE = re.compile("|".join(re.escape(h) for h in _IN_HAND_HINTS))
+
+if AHOCORASICK_AVAILABLE:
+    _IN_HAND_AC = ahocorasick.Automaton()
+    for _hint in _IN_HAND_HINTS:
+        _IN_HAND_AC.add_word(_hint, _hint)
+    _IN_HAND_AC.make_automaton()
+    del _hint
+
+    def _mentions_in_hand(text: str) -> bool:
+        """True if lowercased text contains any in-hand hint."""
+        return next(_IN_HAND_AC.iter(text), None) is not None
+else:
+    def _mentions_in_hand(text: str) -> bool:
+        """True if lowercased text contains any in-hand hint."""
+        return _IN_HAND_RE.search(text) is not None
+
+# Per-object context bits stored in MemoryMeta.object_flags
+_FLAG_IN_HAND = 1 << 0  # Object was being held ("in hand", "carrying", ...)
+
+
+def object_context_flags(context: str) -> int:
+    """
+    Encode an object's context string as MemoryMeta.object_flags bits.
+
+    Args:
+        context: BoundingBox.context (e.g., "on kitchen counter", "in hand")
+
+    Returns:
+        Bitmask of _FLAG_* values (0 if nothing notable)
+    """
+    flags = 0
+    if context and _mentions_in_hand(context.lower()):
+        flags |= _FLAG_IN_HAND
+    return flags
+
+
+@dataclass(slots=True)
+class MemoryMeta:
+    """
+    Lightweight metadata row cached in MemoryIndex.memories.
+
+    One of these is kept in RAM for every stored memory, so it uses
+    __slots__ instead of a per-row dict: on a Pi Zero with ~10k memories
+    that is several megabytes saved, and attribute access is faster than
+    dict lookups during the linear scan in find_by_location.
+
+    Attributes:
+        timestamp: ISO format datetime string
+        location: Scene description (e.g., "kitchen counter")
+        objects: Detected object names
+        object_flags: Context bits per object, parallel to objects (empty for
+                      rows written before flags existed)
+        people: Names heard in the audio transcript
+        persons: Visual person descriptions (e.g., "man in blue shirt")
+        activities: Detected activities
+        image_path: Path to the JPEG on disk
+        tags: Scene tags
+        relationships: Spatial relationships (e.g., "keys on desk")
+        description: Full scene description
+        audio_transcript: Transcribed speech from the scene
+        conversation_context: Summary of what was discussed
+        ts_epoch: timestamp as Unix seconds (0.0 if unparseable)
+        objects_lower: Lowercased object names, parallel to objects
+                       (derived at construction, never persisted)
+        timestamp_ns: ts_epoch as integer nanoseconds, the timeline sort key
+                      (derived at construction, never persisted)
+    """
+    timestamp: str = ""
+    location: str = "unknown"
+    objects: list[str] = field(default_factory=list)
+    object_flags: list[int] = field(default_factory=list)
+    people: list[str] = field(default_factory=list)
+    persons: list[str] = field(default_factory=list)
+    activities: list[str] = field(default_factory=list)
+    image_path: str = ""
+    tags: list[str] = field(default_factory=list)
+    relationships: list[str] = field(default_factory=list)
+    description: str = ""
+    audio_transcript: str = ""
+    conversation_context: str = ""
+    ts_epoch: float = 0.0
+    objects_lower: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    timestamp_ns: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Derived fields rebuilt on load; excluded from memory_index.json
+    _DERIVED = ("objects_lower", "timestamp_ns")
+
+    def __post_init__(self):
+        # Lowercase object names once so per-query filters don't re-lowercase
+        self.objects_lower = tuple(sys.intern(o.lower()) for o in self.objects)
+
+        # Parse the timestamp once here so time math never re-parses it
+        if not self.ts_epoch and self.timestamp:
+            try:
+                self.ts_epoch = datetime.fromisoformat(self.timestamp).timestamp()
+            except ValueError:
+                self.ts_epoch = 0.0
+        self.timestamp_ns = epoch_ns(self.ts_epoch)
+
+    @classmethod
+    def from_memory(cls, memory: Memory) -> "MemoryMeta":
+        """Build the index row for a freshly captured Memory."""
+        return cls(
+            timestamp=memory.timestamp,
+            location=memory.location,
+            objects=memory.object_names(),
+            object_flags=[object_context_flags(o.context) for o in memory.objects],
+            people=list(memory.people),
+            persons=[p.get("description", "") for p in memory.persons if isinstance(p, dict)],
+            activities=list(memory.activities),
+            image_path=memory.image_path,
+            tags=list(memory.tags),
+            relationships=list(memory.relationships),
+            description=memory.description,
+            audio_transcript=memory.audio_transcript,
+            conversation_context=memory.conversation_context,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MemoryMeta":
+        """
+        Build a row from its persisted form.
+
+        Older index files stored list fields as CSV strings ("keys,phone";
+        persons and relationships used ";"), so both shapes are accepted.
+        """
+        def as_list(key: str, sep: str) -> list[str]:
+            value = data.get(key) or []
+            if isinstance(value, str):
+                value = value.split(sep)
+            return [v.strip() for v in value if v and v.strip()]
+
+        objects = as_list("objects", ",")
+        # Flags are only trusted when they line up with the object list
+        flags = data.get("object_flags") or []
+        if len(flags) != len(objects):
+            flags = []
+
+        return cls(
+            timestamp=data.get("timestamp", ""),
+            location=data.get("location", "unknown"),
+            objects=objects,
+            object_flags=list(flags),
+            people=as_list("people", ","),
+            persons=as_list("persons", ";"),
+            activities=as_list("activities", ","),
+            image_path=data.get("image_path", ""),
+            tags=as_list("tags", ","),
+            relationships=as_list("relationships", ";"),
+            description=data.get("description", ""),
+            audio_transcript=data.get("audio_transcript", ""),
+            conversation_context=data.get("conversation_context", ""),
+            ts_epoch=data.get("ts_epoch", 0.0),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict for memory_index.json."""
+        data = asdict(self)
+        for name in self._DERIVED:
+            del data[name]
+        return data
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECTION 5: FILE STORAGE
@@ -1241,7 +1803,8 @@ def save_metadata(memory: Memory) -> None:
         memory: Memory object to save
     """
     path = MEMORY_DIR / f"{memory.id}.json"
-    atomic_write_text(path, json5.dumps({
+    # Strict JSON (json5.dumps leaves keys unquoted) so read_json's fast path applies
+    atomic_write_text(path, json.dumps({
         "id": memory.id,
         "timestamp": memory.timestamp,
         "location": memory.location,
@@ -1260,11 +1823,21 @@ def save_metadata(memory: Memory) -> None:
     }, indent=2))
 
 
+# Recently loaded memories: mem_id → Memory (LRU, most recent last).
+# A search typically records access and then re-loads the same few memories
+# for display/narration, so keeping the last handful avoids repeat disk reads.
+# Kept small for the Pi Zero (512 MB); entries hold metadata, not JPEG bytes.
+_MEMORY_CACHE_SIZE = 16
+_memory_cache: OrderedDict[str, Memory] = OrderedDict()
+
+
 def load_memory(mem_id: str) -> Memory | None:
     """
     Load memory from disk by ID.
     
-    Loads both the JSON metadata and the JPEG image data.
+    Loads both the JSON metadata and the JPEG image data. Results are kept
+    in a small LRU cache; misses (None) are never cached, so a memory whose
+    files appear later is still found.
     
     Args:
         mem_id: Memory ID to load
@@ -1272,13 +1845,92 @@ def load_memory(mem_id: str) -> Memory | None:
     Returns:
         Memory object with image data loaded, or None if not found
     """
+    memory = _memory_cache.get(mem_id)
+    if memory is not None:
+        _memory_cache.move_to_end(mem_id)
+        return memory
+
+    memory = _load_memory_from_disk(mem_id)
+    if memory is not None:
+        _memory_cache[mem_id] = memory
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+    return memory
+
+
+# Worker threads for reading several memory files at once. A search result
+# page needs up to 10 JSON + JPEG reads; the SD card serves small reads in
+# parallel and file reads release the GIL, so overlapping them helps.
+_IO_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _io_pool() -> ThreadPoolExecutor:
+    """Shared read pool, created on first use."""
+    return ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="gem-io")
+
+
+def save_concurrently(*saves: Callable[[], None]) -> None:
+    """
+    Run several independent save functions at the same time.
+
+    Each of our saves ends in its own write + fsync + rename
+    (atomic_write_text); fsync releases the GIL, so running them side by
+    side waits for the slowest flush instead of the sum of all of them,
+    and shortens the window in which one file is newer than the other.
+
+    Args:
+        saves: Zero-argument callables, e.g. index.save
+
+    Raises:
+        The first exception raised by any save (after all have finished)
+    """
+    futures = [_io_pool().submit(save) for save in saves]
+    for future in futures:
+        future.result()
+
+
+def load_memories(mem_ids: list[str]) -> list[Memory | None]:
+    """
+    Load several memories, reading cache misses from disk in parallel.
+
+    Same results as [load_memory(m) for m in mem_ids]. Only the disk reads
+    run on the pool; the LRU cache is read and updated on the calling
+    thread.
+
+    Args:
+        mem_ids: Memory IDs to load
+
+    Returns:
+        Memory (or None if not found) for each ID, in the same order
+    """
+    out: list[Memory | None] = [_memory_cache.get(mem_id) for mem_id in mem_ids]
+    misses = [i for i, memory in enumerate(out) if memory is None]
+    if len(misses) > 1:
+        loaded = _io_pool().map(_load_memory_from_disk, [mem_ids[i] for i in misses])
+    else:
+        loaded = map(_load_memory_from_disk, [mem_ids[i] for i in misses])
+
+    for i, memory in zip(misses, loaded):
+        out[i] = memory
+    for mem_id, memory in zip(mem_ids, out):
+        if memory is not None:
+            _memory_cache[mem_id] = memory
+            _memory_cache.move_to_end(mem_id)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return out
+
+
+def _load_memory_from_disk(mem_id: str) -> Memory | None:
+    """Read one memory's JSON metadata from disk (uncached; JPEG is paged in lazily)."""
     path = MEMORY_DIR / f"{mem_id}.json"
     if not path.exists():
         return None
     
     try:
         # Load JSON metadata
-        data = json5.loads(path.read_text())
+        data = read_json(path)
         
         # Reconstruct Memory object
         memory = Memory(
@@ -1298,19 +1950,40 @@ def load_memory(mem_id: str) -> Memory | None:
             # Episodic memory: WHO dimension (visual persons)
             persons=data.get("persons", [])
         )
-        
-        # Load image data for display (guard against empty/missing paths)
-        if memory.image_path:
-            img_path = Path(memory.image_path)
-            if img_path.exists() and img_path.stat().st_size > 0:
-                memory.image_data = img_path.read_bytes()
-
+        # Image bytes are not read here: Memory.image_buffer() maps the JPEG
+        # only when a renderer actually draws it
         return memory
     except Exception:
         return None
 
 
-def cleanup_old_memories(index: 'MemoryIndex' = None) -> int:
+def _take_valid(mem_ids, k: int) -> list[Memory]:
+    """
+    Load memories in order until k of them load successfully.
+
+    Reads in batches of "how many are still missing", loaded in parallel
+    by load_memories(). Never reads an entry that a one-at-a-time scan
+    wouldn't also have read: nothing past the first k valid hits is touched.
+
+    Args:
+        mem_ids: Memory IDs in priority order (usually newest first)
+        k: Number of valid memories wanted
+
+    Returns:
+        Up to k loaded Memory objects, in the same order as mem_ids
+    """
+    out = []
+    ids = iter(mem_ids)
+    while len(out) < k:
+        batch = list(islice(ids, k - len(out)))
+        if not batch:
+            break
+        out.extend(memory for memory in load_memories(batch) if memory is not None)
+    return out
+
+
+def cleanup_old_memories(index: 'MemoryIndex' = None,
+                         lock: 'threading.Lock | None' = None) -> int:
     """
     Delete lowest-scoring memories when exceeding MAX_MEMORIES limit.
 
@@ -1322,10 +1995,14 @@ def cleanup_old_memories(index: 'MemoryIndex' = None) -> int:
 
     Args:
         index: Optional MemoryIndex to score memories and remove deleted entries
+        lock: Held only while scoring and detaching memories from the index
+              (the daemon's persist_lock); the file deletions run without it
 
     Returns:
         Number of memories deleted
     """
+    guard = lock or contextlib.nullcontext()
+
     # Get all memory files sorted by name (oldest first due to timestamp in name)
     memory_files = sorted(MEMORY_DIR.glob("mem_*.json"))
 
@@ -1336,54 +2013,62 @@ def cleanup_old_memories(index: 'MemoryIndex' = None) -> int:
     to_delete = len(memory_files) - MAX_MEMORIES
     deleted = 0
 
-    if index:
-        # --- DECAY-BASED CLEANUP (Ebbinghaus forgetting curve) ---
-        # Instead of simply deleting oldest memories, we score each memory
-        # using decay_score() which combines:
-        #   1. Recency (exponential decay, 7-day half-life)
-        #   2. Retrieval boost (+0.1 per search access, max +1.0)
-        # This means a 30-day-old memory that's been searched 10 times
-        # (score ~1.05) survives over a 7-day-old memory never searched
-        # (score ~0.5). This mimics how human recall strengthens traces.
-        scored = []
-        for json_path in memory_files:
-            mem_id = json_path.stem
-            score = index.decay_score(mem_id)
-            scored.append((score, json_path))
-        # Sort ascending — lowest scores (old + never recalled) forgotten first
-        scored.sort(key=lambda x: x[0])
-        candidates = [path for _, path in scored[:to_delete]]
-    else:
-        # Fallback without index: simple oldest-first (FIFO)
-        candidates = memory_files[:to_delete]
+    with guard:
+        if index:
+            # --- DECAY-BASED CLEANUP (Ebbinghaus forgetting curve) ---
+            # Instead of simply deleting oldest memories, we score each memory
+            # using decay_score() which combines:
+            #   1. Recency (exponential decay, 7-day half-life)
+            #   2. Retrieval boost (+0.1 per search access, max +1.0)
+            # This means a 30-day-old memory that's been searched 10 times
+            # (score ~1.05) survives over a 7-day-old memory never searched
+            # (score ~0.5). This mimics how human recall strengthens traces.
+            scored = []
+            for json_path in memory_files:
+                mem_id = json_path.stem
+                score = index.decay_score(mem_id)
+                scored.append((score, json_path))
+            # Sort ascending — lowest scores (old + never recalled) forgotten first
+            scored.sort(key=lambda x: x[0])
+            candidates = [path for _, path in scored[:to_delete]]
+        else:
+            # Fallback without index: simple oldest-first (FIFO)
+            candidates = memory_files[:to_delete]
 
-    # Delete candidate memories from disk and all in-memory indexes
-    for json_path in candidates:
-        try:
+        # Detach candidates from the caches and all in-memory indexes first,
+        # so searches stop returning them before their files disappear
+        for json_path in candidates:
             mem_id = json_path.stem
-            jpg_path = MEMORY_DIR / f"{mem_id}.jpg"
-
-            # Delete both files together. If one fails, the other is still
-            # cleaned up — orphans are harmless and will be caught next cycle.
-            json_path.unlink(missing_ok=True)
-            jpg_path.unlink(missing_ok=True)
-
-            # Remove from in-memory indexes to stay consistent with disk.
-            # The by_object hash maps object_name → {mem_id_1, mem_id_2, ...}.
-            # We must remove this mem_id from every object set that references it,
-            # otherwise searches would return deleted memories.
-            # We use .discard() (not .remove()) because it won't error if missing.
+            _memory_cache.pop(mem_id, None)  # Don't serve a forgotten memory
+            for key in [k for k in _annotate_cache if k[0] == mem_id]:
+                del _annotate_cache[key]
+
+            # The by_object hash maps object_name → [mem_id_1, mem_id_2, ...]
+            # (likewise by_person / by_activity). We must remove this mem_id
+            # from every posting list that references it, otherwise searches
+            # would return deleted memories.
+            # _unpost() is a no-op if the ID is already missing.
             if index and mem_id in index.memories:
-                meta = index.memories.get(mem_id, {})
-                for obj in meta.get('objects', '').split(','):
-                    obj = obj.strip().lower()
-                    if obj and obj in index.by_object:
-                        index.by_object[obj].discard(mem_id)
+                meta = index.memories[mem_id]
+                index._unindex_meta(mem_id, meta)
+                entry = (meta.timestamp_ns, mem_id)
+                i = bisect_left(index._timeline, entry)
+                if i < len(index._timeline) and index._timeline[i] == entry:
+                    del index._timeline[i]
                 del index.memories[mem_id]
+                index._time_cache.clear()
             # Remove access log entry to prevent unbounded growth
             if index:
                 index.access_log.pop(mem_id, None)
+                index._access_buffer.pop(mem_id, None)
 
+    # Delete candidate memories from disk (slow on microSD: outside the lock)
+    for json_path in candidates:
+        try:
+            # Delete both files together. If one fails, the other is still
+            # cleaned up — orphans are harmless and will be caught next cycle.
+            json_path.unlink(missing_ok=True)
+            (MEMORY_DIR / f"{json_path.stem}.jpg").unlink(missing_ok=True)
             deleted += 1
         except Exception:
             pass
@@ -1556,6 +2241,27 @@ def frame_difference(f1: np.ndarray, f2: np.ndarray) -> float:
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=8)
+def load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """
+    DejaVu Sans Bold at the given size, or PIL's default font if missing.
+
+    Cached: parsing the TTF costs more than drawing a few lines with it,
+    and the LCD/annotation code only uses a handful of sizes.
+    """
+    try:
+        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+# Recently annotated results: (mem_id, highlight, info_text) → JPEG bytes (LRU).
+# Asking the same question twice ("where are my keys?") returns the same
+# memory and banner, so the decode + draw + re-encode can be skipped.
+_ANNOTATE_CACHE_SIZE = 8
+_annotate_cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+
+
 def annotate_image(memory: Memory, highlight: str = "",
                    info_text: str = "") -> bytes:
     """
@@ -1588,22 +2294,27 @@ def annotate_image(memory: Memory, highlight: str = "",
         │ moved from living room, 5m ago │
         └────────────────────────────────┘
     """
-    if not memory.image_data:
+    # Same memory, highlight and banner as a recent call → same picture
+    # (checked first, so a hit doesn't even map the JPEG)
+    cache_key = (memory.id, highlight, info_text)
+    cached = _annotate_cache.get(cache_key)
+    if cached is not None:
+        _annotate_cache.move_to_end(cache_key)
+        return cached
+
+    image = memory.image_buffer()
+    if not image:
         return b""
     
     try:
-        # Load image from bytes
-        img = Image.open(io.BytesIO(memory.image_data))
+        # Decode straight from the mmap (it has read/seek/tell, so PIL reads
+        # pages as it decodes); fresh captures' bytes need a BytesIO wrapper
+        img = Image.open(image if isinstance(image, mmap.mmap) else io.BytesIO(image))
         draw = ImageDraw.Draw(img)
         w, h = img.size
         
         # Try to load a nice font, fall back to default
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-        except Exception:
-            font = ImageFont.load_default()
+        font = load_font(14)
         
         # Draw each bounding box
         for obj in memory.objects:
@@ -1633,12 +2344,7 @@ def annotate_image(memory: Memory, highlight: str = "",
         # Draw info banner at bottom if provided
         if info_text:
             # Use larger font for info text (readable on small LCD)
-            try:
-                small_font = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16
-                )
-            except Exception:
-                small_font = font
+            small_font = load_font(16)
 
             # Split text into lines that fit the image width
             lines = []
@@ -1681,10 +2387,14 @@ def annotate_image(memory: Memory, highlight: str = "",
         # Convert back to JPEG bytes
         buf = io.BytesIO()
         img.save(buf, format="JPEG", quality=85)
-        return buf.getvalue()
+        annotated = buf.getvalue()
+        _annotate_cache[cache_key] = annotated
+        if len(_annotate_cache) > _ANNOTATE_CACHE_SIZE:
+            _annotate_cache.popitem(last=False)
+        return annotated
         
     except Exception:
-        return memory.image_data  # Return original on error
+        return bytes(image)  # Return original on error (not cached)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1704,13 +2414,323 @@ def annotate_image(memory: Memory, highlight: str = "",
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class WhisplayHAT:
+# ALSA devices for the HAT speaker and microphone (WM8960, card 0)
+SPEAKER_DEVICE = "plughw:0,0"
+MIC_DEVICE = "plughw:0,0"
+MIC_RATE = 16000  # 16kHz, 16-bit mono: plenty for speech
+SPEECH_RMS_THRESHOLD = 500  # int16 RMS above which a clip/period counts as voiced (~-36 dBFS)
+SILENCE_STOP_SECONDS = 0.5  # Trailing silence that ends a stop_on_silence recording
+
+# aplay invocation for the HAT speaker; "-" reads the WAV from stdin
+APLAY_CMD = ["aplay", "-D", SPEAKER_DEVICE, "-q", "-"]
+
+# WAV sample width (bytes) → ALSA sample format, for in-process playback
+_ALSA_FORMATS = {
+    1: "PCM_FORMAT_U8",
+    2: "PCM_FORMAT_S16_LE",
+    3: "PCM_FORMAT_S24_3LE",
+    4: "PCM_FORMAT_S32_LE",
+}
+_ALSA_PERIOD_FRAMES = 1024
+
+
+def _l16_rate(mime_type: str) -> int | None:
     """
-    Interface for Whisplay HAT hardware components.
-    
-    Provides unified access to:
-    - LCD display (show images and text)
-    - Microphone (record voice queries)
+    Sample rate of headerless 16-bit PCM ("audio/L16;codec=pcm;rate=24000").
+
+    Gemini TTS returns this instead of WAV. Despite the L16 name the
+    samples are little-endian, so it plays as S16_LE mono.
+
+    Returns:
+        Rate in Hz (24000 if the MIME type omits it), or None if not L16
+    """
+    mime = mime_type.lower()
+    if not mime.startswith("audio/l16"):
+        return None
+    rate = re.search(r"rate=([0-9]+)", mime)
+    return int(rate.group(1)) if rate else 24000
+
+
+def _play_wav_alsa(audio_data: bytes, mime_type: str = "audio/wav") -> None:
+    """
+    Play audio bytes on SPEAKER_DEVICE through pyalsaaudio (blocks until done).
+
+    A RIFF/WAV clip opens the PCM with its own rate/channels/format;
+    headerless L16 PCM (Gemini TTS) uses the rate from its MIME type.
+    Either way one period is written at a time. The device is closed (and
+    drained) afterwards rather than held open: the daemon and search
+    processes share the speaker, and an open hw PCM would lock the other
+    one out.
+
+    Args:
+        audio_data: WAV file bytes, or raw PCM described by mime_type
+        mime_type: MIME type from Gemini (only consulted without a RIFF header)
+
+    Raises:
+        wave.Error / EOFError: If audio_data is neither a valid WAV nor L16
+        alsaaudio.ALSAAudioError: If the device can't be opened or written
+    """
+    rate = None if audio_data[:4] == b"RIFF" else _l16_rate(mime_type)
+    if rate is not None:
+        pcm = alsaaudio.PCM(alsaaudio.PCM_PLAYBACK, alsaaudio.PCM_NORMAL,
+                            rate=rate, channels=1, format=alsaaudio.PCM_FORMAT_S16_LE,
+                            periodsize=_ALSA_PERIOD_FRAMES, device=SPEAKER_DEVICE)
+        try:
+            view = memoryview(audio_data)[:len(audio_data) & ~1]  # Whole samples only
+            step = _ALSA_PERIOD_FRAMES * 2  # S16_LE mono: 2 bytes per frame
+            for pos in range(0, len(view), step):
+                pcm.write(view[pos:pos + step])
+        finally:
+            pcm.close()
+        return
+
+    with wave.open(io.BytesIO(audio_data), "rb") as wav:
+        fmt = getattr(alsaaudio, _ALSA_FORMATS[wav.getsampwidth()])
+        channels = wav.getnchannels()
+        pcm = alsaaudio.PCM(alsaaudio.PCM_PLAYBACK, alsaaudio.PCM_NORMAL,
+                            rate=wav.getframerate(), channels=channels, format=fmt,
+                            periodsize=_ALSA_PERIOD_FRAMES, device=SPEAKER_DEVICE)
+        try:
+            while frames := wav.readframes(_ALSA_PERIOD_FRAMES):
+                pcm.write(frames)
+        finally:
+            pcm.close()
+
+
+def pcm_rms(samples) -> float:
+    """
+    Root-mean-square level of 16-bit little-endian PCM samples.
+
+    Args:
+        samples: Raw int16 sample bytes (no header); an odd trailing byte is ignored
+
+    Returns:
+        RMS in int16 units (0 for an empty buffer)
+    """
+    x = np.frombuffer(samples, dtype="<i2", count=len(samples) // 2)
+    if not x.size:
+        return 0.0
+    return float(np.sqrt(np.mean(np.square(x, dtype=np.float64))))
+
+
+def wav_peak_rms(audio: bytes) -> float:
+    """
+    Loudest per-period RMS of a 16-bit mono WAV clip (skips the 44-byte header).
+
+    Uses the same ~64 ms windows (_ALSA_PERIOD_FRAMES) as the recorder's
+    silence check, so a short utterance in a mostly quiet clip still
+    counts as voiced; a whole-clip RMS would average it away.
+
+    Args:
+        audio: WAV bytes from record_audio()
+
+    Returns:
+        Highest window RMS in int16 units (0 for an empty clip)
+    """
+    x = np.frombuffer(audio, dtype="<i2", count=max(len(audio) - 44, 0) // 2,
+                      offset=min(44, len(audio)))
+    if not x.size:
+        return 0.0
+    n = -(-x.size // _ALSA_PERIOD_FRAMES)  # Windows, last one zero-padded
+    windows = np.zeros(n * _ALSA_PERIOD_FRAMES, dtype=np.float64)
+    windows[:x.size] = x
+    windows = windows.reshape(n, _ALSA_PERIOD_FRAMES)
+    return float(np.sqrt(np.square(windows).mean(axis=1).max()))
+
+
+def _record_wav_alsa(duration: int, stop_on_silence: bool = False) -> bytes:
+    """
+    Record duration seconds from MIC_DEVICE through pyalsaaudio as WAV bytes.
+
+    The whole clip is known-size, so one buffer (44-byte header + samples)
+    is allocated up front and each ALSA period is copied into place through
+    a memoryview - no per-chunk bytes objects joined afterwards.
+
+    With stop_on_silence, each period's RMS is checked as it arrives and
+    the recording ends once SILENCE_STOP_SECONDS of quiet follows speech,
+    instead of always running the full duration.
+
+    Args:
+        duration: Recording duration in seconds (maximum, with stop_on_silence)
+        stop_on_silence: End early after speech followed by silence
+
+    Returns:
+        WAV bytes (16kHz, 16-bit, mono)
+
+    Raises:
+        alsaaudio.ALSAAudioError: If the device can't be opened or read
+    """
+    n_data = MIC_RATE * 2 * duration
+    buf = bytearray(44 + n_data)
+    struct.pack_into("<4sI4s4sIHHIIHH4sI", buf, 0,
+                     b"RIFF", 36 + n_data, b"WAVE", b"fmt ", 16,
+                     1, 1, MIC_RATE, MIC_RATE * 2, 2, 16,  # PCM, mono, 16-bit
+                     b"data", n_data)
+    view = memoryview(buf)
+    pcm = alsaaudio.PCM(alsaaudio.PCM_CAPTURE, alsaaudio.PCM_NORMAL,
+                        rate=MIC_RATE, channels=1, format=alsaaudio.PCM_FORMAT_S16_LE,
+                        periodsize=_ALSA_PERIOD_FRAMES, device=MIC_DEVICE)
+    try:
+        pos = 44
+        voiced = False
+        quiet_bytes = 0
+        quiet_limit = int(MIC_RATE * SILENCE_STOP_SECONDS) * 2
+        deadline = time.monotonic() + duration + 5  # Same margin as arecord's timeout
+        while pos < len(buf) and time.monotonic() < deadline:
+            frames, data = pcm.read()
+            if frames <= 0:
+                continue  # Overrun: ALSA recovers on the next read
+            n = min(len(data), len(buf) - pos)
+            view[pos:pos + n] = data[:n]
+            pos += n
+            if stop_on_silence:
+                if pcm_rms(view[pos - n:pos]) >= SPEECH_RMS_THRESHOLD:
+                    voiced, quiet_bytes = True, 0
+                elif voiced:
+                    quiet_bytes += n
+                    if quiet_bytes >= quiet_limit:
+                        break  # Speaker finished
+    finally:
+        pcm.close()
+    if pos < len(buf):
+        # Stopped early (silence) or cut short (device stalled):
+        # fix the RIFF and data chunk sizes
+        struct.pack_into("<I", buf, 4, pos - 8)
+        struct.pack_into("<I", buf, 40, pos - 44)
+    return bytes(view[:pos])
+
+
+def play_wav_bytes(audio_data: bytes, blocking: bool = False, timeout: float = 30,
+                   mime_type: str = "audio/wav") -> None:
+    """
+    Play WAV (or Gemini's headerless L16 PCM) bytes through the HAT speaker.
+
+    With pyalsaaudio installed the clip is written to ALSA in-process (no
+    fork/exec of aplay per clip); otherwise it is piped into aplay. No temp
+    file and no shell either way: the audio never touches the SD card,
+    which matters for card wear in long-running marathon mode.
+
+    Args:
+        audio_data: Complete WAV file bytes, or raw PCM described by mime_type
+        blocking: If True, wait for playback to finish
+        timeout: Max seconds to wait when blocking (aplay is killed after;
+                 in-process playback always runs to the end of the clip)
+        mime_type: MIME type from Gemini, e.g. "audio/L16;codec=pcm;rate=24000"
+
+    Raises:
+        Exception: When blocking, if playback fails (ALSA error or aplay
+                   exiting non-zero). Background playback only logs it.
+    """
+    if ALSAAUDIO_AVAILABLE:
+        if blocking:
+            _play_wav_alsa(audio_data, mime_type)
+            return
+
+        def play():
+            try:
+                _play_wav_alsa(audio_data, mime_type)
+            except Exception as e:
+                log_error(f"ALSA playback failed: {e}")
+
+        threading.Thread(target=play, daemon=True).start()
+        return
+
+    cmd = APLAY_CMD if audio_data[:4] == b"RIFF" else _aplay_cmd_for(mime_type)
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def feed():
+        # aplay consumes the pipe at playback speed, so this write can
+        # take as long as the clip; it runs on its own thread when
+        # non-blocking and reaps the process when done.
+        try:
+            proc.stdin.write(audio_data)
+            proc.stdin.close()
+        except OSError:
+            pass  # aplay exited early (e.g., no audio device)
+        if not blocking:
+            proc.wait()
+
+    if not blocking:
+        threading.Thread(target=feed, daemon=True).start()
+        return
+
+    feed()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()  # Clip ran past the timeout: cut it off
+        proc.wait()
+        return
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _aplay_cmd_for(mime_type: str) -> list[str]:
+    """
+    aplay command line for one audio MIME type.
+
+    WAV carries its own header. Gemini's streamed TTS is headerless PCM
+    ("audio/L16;codec=pcm;rate=24000"), so aplay is told the format.
+    """
+    rate = _l16_rate(mime_type)
+    if rate is None:
+        return APLAY_CMD
+    return APLAY_CMD[:-1] + ["-t", "raw", "-f", "S16_LE", "-c", "1", "-r", str(rate), "-"]
+
+
+def play_audio_stream(chunks: Iterator[tuple[str, bytes]], blocking: bool = False,
+                      timeout: float = 30) -> None:
+    """
+    Play audio chunks through the HAT speaker as they arrive.
+
+    aplay is started on the first chunk (its MIME type picks the format) and
+    each later chunk is written to its stdin straight away, so playback
+    begins while the rest is still being generated. The pipe buffers
+    between the network and the speaker.
+
+    Args:
+        chunks: (mime_type, audio bytes) pairs, e.g. from GeminiClient.tts_stream()
+        blocking: If True, wait for playback to finish
+        timeout: Max seconds to wait for aplay after the last chunk when blocking
+    """
+    def feed():
+        proc = None
+        try:
+            for mime_type, data in chunks:
+                if proc is None:
+                    proc = subprocess.Popen(_aplay_cmd_for(mime_type), stdin=subprocess.PIPE,
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                proc.stdin.write(data)
+        except OSError:
+            pass  # aplay exited early (e.g., no audio device)
+        except Exception as e:
+            log_error(f"Audio stream failed: {e}")
+        if proc is None:
+            return  # Nothing arrived
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=timeout if blocking else None)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    if blocking:
+        feed()
+    else:
+        threading.Thread(target=feed, daemon=True).start()
+
+
+class WhisplayHAT:
+    """
+    Interface for Whisplay HAT hardware components.
+    
+    Provides unified access to:
+    - LCD display (show images and text)
+    - Microphone (record voice queries)
     - LED (status indication)
     - Button (trigger search)
     
@@ -1740,6 +2760,10 @@ class WhisplayHAT:
         self.mic = False
         self.headless = headless
 
+        # Button press pipe (see button_fd): read end, write end
+        self._button_r: int | None = None
+        self._button_w: int | None = None
+
         # Always check for microphone (uses ALSA, independent of board)
         self.mic = self._check_mic()
 
@@ -1807,7 +2831,8 @@ class WhisplayHAT:
         except Exception:
             return False
     
-    def _to_rgb565(self, img: Image.Image) -> bytes:
+    @staticmethod
+    def _to_rgb565(img: Image.Image) -> bytes:
         """
         Convert PIL Image to RGB565 format for LCD using NumPy vectorization.
 
@@ -1859,8 +2884,13 @@ class WhisplayHAT:
             return
 
         try:
-            # Load and convert to RGB
-            img = Image.open(io.BytesIO(image_bytes)).convert('RGB')
+            # Load and convert to RGB. For JPEGs, draft() has libjpeg decode
+            # straight at the 1/2, 1/4 or 1/8 scale that still covers the LCD
+            # (DCT-domain scaling), instead of decoding every pixel of a
+            # camera frame only for thumbnail() to throw most away.
+            img = Image.open(io.BytesIO(image_bytes))
+            img.draft('RGB', (HAT_LCD_WIDTH, HAT_LCD_HEIGHT))
+            img = img.convert('RGB')
 
             # Resize to fit LCD while maintaining aspect ratio
             img.thumbnail((HAT_LCD_WIDTH, HAT_LCD_HEIGHT), Image.Resampling.LANCZOS)
@@ -1874,12 +2904,7 @@ class WhisplayHAT:
             # Draw info text overlay at bottom (AFTER scaling, so always readable)
             if info_text:
                 draw = ImageDraw.Draw(bg)
-                try:
-                    font = ImageFont.truetype(
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18
-                    )
-                except Exception:
-                    font = ImageFont.load_default()
+                font = load_font(18)
 
                 # Split into lines and draw at bottom
                 lines = info_text.split('\n')[:3]  # Max 3 lines
@@ -1887,11 +2912,10 @@ class WhisplayHAT:
                 banner_height = len(lines) * line_height + 6
                 banner_y = HAT_LCD_HEIGHT - banner_height
 
-                # Semi-transparent black banner
-                for by in range(banner_y, HAT_LCD_HEIGHT):
-                    for bx in range(HAT_LCD_WIDTH):
-                        r, g, b = bg.getpixel((bx, by))
-                        bg.putpixel((bx, by), (r // 3, g // 3, b // 3))
+                # Semi-transparent black banner: darken the strip to 1/3
+                # brightness in one lookup-table pass (not per pixel)
+                banner = bg.crop((0, banner_y, HAT_LCD_WIDTH, HAT_LCD_HEIGHT))
+                bg.paste(banner.point(lambda v: v // 3), (0, banner_y))
 
                 # Draw text
                 ty = banner_y + 3
@@ -1904,7 +2928,8 @@ class WhisplayHAT:
         except Exception as e:
             log_error(f"display_image failed: {e}")
     
-    def display_text(self, text: str, color=(255, 255, 255)):
+    def display_text(self, text: str, color=(255, 255, 255),
+                     led: tuple[int, int, int] | None = None):
         """
         Display centered text on LCD.
         
@@ -1914,46 +2939,61 @@ class WhisplayHAT:
         Args:
             text: Text to display (use \\n for line breaks)
             color: RGB tuple for text color (default: white)
+            led: Optional RGB LED color for the same state change. The frame
+                 is rendered first, then LED and frame are sent back to back,
+                 so they change together rather than a render apart.
         """
         if not self.board:
             return
             
         try:
-            # Create black background
-            img = Image.new('RGB', (HAT_LCD_WIDTH, HAT_LCD_HEIGHT), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Load font
-            try:
-                font = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20
-                )
-            except Exception:
-                font = ImageFont.load_default()
-            
-            # Draw each line centered
-            y = 60  # Start 60 pixels from top
-            for line in text.split('\n'):
-                bbox = draw.textbbox((0, 0), line, font=font)
-                x = (HAT_LCD_WIDTH - (bbox[2] - bbox[0])) // 2
-                draw.text((x, y), line, fill=color, font=font)
-                y += 35  # 35 pixels between lines
-            
-            # Send to display
-            self.board.draw_image(0, 0, HAT_LCD_WIDTH, HAT_LCD_HEIGHT, self._to_rgb565(img))
+            # Status screens repeat, so this is usually a cache hit
+            frame = self._render_text(text, tuple(color))
+            if led is not None:
+                self.board.set_rgb(*led)
+            self.board.draw_image(0, 0, HAT_LCD_WIDTH, HAT_LCD_HEIGHT, frame)
 
         except Exception as e:
             log_error(f"display_text failed: {e}")
 
-    def record_audio(self, duration: int = RECORD_DURATION) -> bytes | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _render_text(text: str, color: tuple[int, int, int]) -> bytes:
+        """
+        Render display_text()'s screen as LCD-ready RGB565 bytes.
+
+        Cached by (text, color): "Ready!", "Listening...", "Transcribing..."
+        are shown on every query, and re-rasterizing their glyphs each time
+        is the expensive part of display_text(). 16 frames ≈ 2 MB.
+        """
+        # Create black background
+        img = Image.new('RGB', (HAT_LCD_WIDTH, HAT_LCD_HEIGHT), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        font = load_font(20)
+
+        # Draw each line centered
+        y = 60  # Start 60 pixels from top
+        for line in text.split('\n'):
+            bbox = draw.textbbox((0, 0), line, font=font)
+            x = (HAT_LCD_WIDTH - (bbox[2] - bbox[0])) // 2
+            draw.text((x, y), line, fill=color, font=font)
+            y += 35  # 35 pixels between lines
+
+        return WhisplayHAT._to_rgb565(img)
+
+    def record_audio(self, duration: int = RECORD_DURATION,
+                     stop_on_silence: bool = False) -> bytes | None:
         """
         Record audio from WM8960 microphone.
         
-        Uses ALSA's arecord utility to capture audio.
-        LED turns red during recording to provide visual feedback.
+        Records in-process through pyalsaaudio when installed, else with
+        ALSA's arecord utility. LED turns red during recording to provide
+        visual feedback.
         
         Args:
             duration: Recording duration in seconds (default: 3)
+            stop_on_silence: End early once speech is followed by silence
+                             (in-process recording only; arecord runs full length)
             
         Returns:
             WAV audio bytes (16kHz, 16-bit, mono) or None on error
@@ -1968,28 +3008,32 @@ class WhisplayHAT:
             self.board.set_rgb(255, 0, 0)  # Red
         
         try:
-            # Record using ALSA
-            # WM8960 is card 0 on Pi with Whisplay HAT
-            result = subprocess.run([
-                "arecord",
-                "-D", "plughw:0,0",   # WM8960 device (card 0)
-                "-f", "S16_LE",       # 16-bit signed little-endian
-                "-r", "16000",        # 16kHz sample rate (good for speech)
-                "-c", "1",            # Mono (single channel)
-                "-t", "wav",          # WAV format with header
-                "-d", str(duration),  # Duration in seconds
-                "-q",                 # Quiet (no progress output)
-                "-"                   # Output to stdout
-            ], capture_output=True, timeout=duration + 5)
+            if ALSAAUDIO_AVAILABLE:
+                audio = _record_wav_alsa(duration, stop_on_silence)
+            else:
+                # Record using ALSA
+                # WM8960 is card 0 on Pi with Whisplay HAT
+                result = subprocess.run([
+                    "arecord",
+                    "-D", MIC_DEVICE,      # WM8960 device (card 0)
+                    "-f", "S16_LE",        # 16-bit signed little-endian
+                    "-r", str(MIC_RATE),   # 16kHz sample rate (good for speech)
+                    "-c", "1",             # Mono (single channel)
+                    "-t", "wav",           # WAV format with header
+                    "-d", str(duration),   # Duration in seconds
+                    "-q",                  # Quiet (no progress output)
+                    "-"                    # Output to stdout
+                ], capture_output=True, timeout=duration + 5)
+                audio = result.stdout if result.returncode == 0 else b""
             
             # Reset LED to blue
             if self.board:
                 self.board.set_rgb(0, 100, 255)
             
             # Check if we got valid audio (WAV files are at least 44 bytes)
-            if result.returncode == 0 and len(result.stdout) > 10000:
-                log(f"   Recorded {len(result.stdout)//1024}KB")
-                return result.stdout
+            if len(audio) > 10000:
+                log(f"   Recorded {len(audio)//1024}KB")
+                return audio
                 
         except Exception:
             if self.board:
@@ -2016,37 +3060,57 @@ class WhisplayHAT:
         if not tts_enabled or not gemini:
             return
 
-        # Clean text for speech (remove special characters)
-        clean_text = text.replace('\n', ' ').replace('📍', '').replace('📌', '')
-        clean_text = clean_text.replace('🕐', '').replace('📋', '').strip()
-
+        clean_text = self._speech_text(text)
         if not clean_text:
             return
 
-        # Limit length for responsiveness
-        if len(clean_text) > 200:
-            clean_text = clean_text[:197] + "..."
-
         try:
-            audio_data = gemini.text_to_speech(clean_text)
-            if audio_data:
-                # Save to temp file and play with aplay
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    f.write(audio_data)
-                    temp_path = f.name
-
-                if blocking:
-                    subprocess.run(["aplay", "-D", "plughw:0,0", "-q", temp_path], timeout=30, capture_output=True)
-                    os.unlink(temp_path)
-                else:
-                    # Play and cleanup in background
-                    subprocess.Popen(
-                        f"aplay -D plughw:0,0 -q {temp_path} && rm {temp_path}",
-                        shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                    )
+            tts = gemini.text_to_speech(clean_text)
+            if tts:
+                # Straight to the speaker (background unless blocking)
+                mime_type, audio_data = tts
+                play_wav_bytes(audio_data, blocking=blocking, mime_type=mime_type)
         except Exception as e:
             log_error(f"Gemini TTS failed: {e}")
 
+    def speak_stream(self, text: str, blocking: bool = False, gemini: 'GeminiClient | None' = None,
+                     for_search: bool = False):
+        """
+        Speak text aloud, starting playback as soon as Gemini sends audio.
+
+        Same settings and text cleanup as speak(), but uses streaming TTS:
+        the first words play after the first chunk arrives instead of after
+        the whole utterance has been synthesized. Used for search answers,
+        where the user is waiting on the reply.
+
+        Args:
+            text: Text to speak (keep short for responsiveness)
+            blocking: If True, wait for speech to complete (default: False)
+            gemini: GeminiClient instance for TTS (required)
+            for_search: If True, use SEARCH_TTS_ENABLED setting (default: False)
+        """
+        tts_enabled = SEARCH_TTS_ENABLED if for_search else TTS_ENABLED
+        if not tts_enabled or not gemini:
+            return
+
+        clean_text = self._speech_text(text)
+        if not clean_text:
+            return
+
+        # Network reads and playback both happen on the feeder thread
+        # (unless blocking), so this returns immediately
+        play_audio_stream(gemini.tts_stream(clean_text), blocking=blocking)
+
+    @staticmethod
+    def _speech_text(text: str) -> str:
+        """Strip newlines/emoji and cap length so TTS stays short."""
+        # Clean text for speech (remove special characters)
+        clean_text = text.replace('\n', ' ').replace('📍', '').replace('📌', '')
+        clean_text = clean_text.replace('🕐', '').replace('📋', '').strip()
+
+        # Limit length for responsiveness
+        return _truncate(clean_text, 200)
+
     def button_pressed(self) -> bool:
         """
         Check if button is currently pressed.
@@ -2055,6 +3119,116 @@ class WhisplayHAT:
             True if button is pressed, False otherwise
         """
         return self.board.button_pressed() if self.board else False
+
+    def button_fd(self) -> int:
+        """
+        File descriptor that becomes readable once per button press.
+
+        Lets a caller block in select() on the button and stdin together
+        instead of waking every 100ms to check both. The first call starts
+        a watcher thread that samples the button (the driver only reports
+        the pin level), waits for release as debounce, then writes one byte.
+
+        Returns:
+            Read end of the press pipe (non-blocking)
+        """
+        if self._button_r is None:
+            self._button_r, self._button_w = os.pipe()
+            os.set_blocking(self._button_r, False)
+            threading.Thread(target=self._watch_button, name="gem-button", daemon=True).start()
+        return self._button_r
+
+    def take_button_presses(self) -> int:
+        """
+        Consume presses signalled on button_fd().
+
+        Returns:
+            Number of presses since the last call (0 if none)
+        """
+        if self._button_r is None:
+            return 0
+        count = 0
+        try:
+            while chunk := os.read(self._button_r, 64):
+                count += len(chunk)
+        except BlockingIOError:
+            pass  # Pipe drained
+        return count
+
+    def wait_for_button(self, timeout: float) -> bool:
+        """
+        Sleep until the next button press or until timeout.
+
+        Presses made before the call are discarded first (e.g. taps while a
+        search was running). The wait is a kernel epoll on button_fd(), so
+        the calling thread uses no CPU until the press arrives.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the button was pressed, False on timeout or without a board
+        """
+        if not self.board:
+            return False
+        fd = self.button_fd()
+        self.take_button_presses()
+        if hasattr(select, "epoll"):
+            with select.epoll(1) as ep:
+                ep.register(fd, select.EPOLLIN)
+                ready = ep.poll(timeout)
+        else:
+            ready = select.select([fd], [], [], timeout)[0]  # Non-Linux dev machines
+        return bool(ready) and self.take_button_presses() > 0
+
+    def _button_edge_waiter(self) -> Callable[[], None]:
+        """
+        Blocking "wait until the button level may have changed" for _watch_button.
+
+        If the driver exposes its button pin (BUTTON_PIN), block in the kernel
+        on a GPIO edge via RPi.GPIO.wait_for_edge, so an idle HAT costs no
+        wakeups and a press is seen immediately; the timeout only lets the
+        thread notice cleanup(). Otherwise - or if the pin already has edge
+        detection configured - sample every BUTTON_POLL_INTERVAL.
+
+        Returns:
+            Zero-argument function that returns after an edge or a short wait
+        """
+        pin = getattr(self.board, "BUTTON_PIN", None)
+        try:
+            import RPi.GPIO as GPIO
+        except ImportError:
+            pin = None
+
+        use_edges = pin is not None
+
+        def wait():
+            nonlocal use_edges
+            if use_edges:
+                try:
+                    GPIO.wait_for_edge(pin, GPIO.BOTH, timeout=BUTTON_EDGE_TIMEOUT_MS)
+                    return
+                except RuntimeError:
+                    use_edges = False  # Conflicting edge detection: fall back to sampling
+            time.sleep(BUTTON_POLL_INTERVAL)
+
+        return wait
+
+    def _watch_button(self):
+        """Watcher thread for button_fd(): one byte per press-and-release."""
+        wait = self._button_edge_waiter()
+        try:
+            while (board := self.board) is not None:
+                if not board.button_pressed():
+                    wait()
+                    continue
+                # Debounce: wait for button release before signalling
+                while board.button_pressed():
+                    wait()
+                os.write(self._button_w, b"\x01")
+                time.sleep(0.1)  # Extra debounce delay
+        except Exception:
+            pass  # Board released (cleanup) or GPIO error: stop watching
     
     def cleanup(self):
         """
@@ -2238,6 +3412,71 @@ relationships: spatial relations between objects.
 Scan the ENTIRE image thoroughly. Report every object, person, AND activity you can identify."""
 
 
+class ResponseCache:
+    """
+    Small persistent TTL cache for Gemini text answers.
+
+    "Where are my keys?" asked twice, or "this morning" asked again
+    before anything new was captured, produces the same prompt - and the
+    same 0.5-2 s Gemini round trip. Answers are kept in one JSON file
+    keyed by a string describing the prompt inputs, so they also survive
+    a power cycle. Only successful answers are stored.
+    """
+
+    def __init__(self, path: Path, ttl: float = LLM_CACHE_TTL, max_entries: int = 64):
+        """
+        Args:
+            path: JSON file to persist to (read on first use)
+            ttl: Seconds an entry stays valid (0 disables caching)
+            max_entries: Oldest entries beyond this are dropped on write
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key → [expires_epoch, value], in insertion order (oldest first)
+        self._entries: dict[str, list] | None = None
+
+    def _load(self) -> dict[str, list]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if self.path.exists():
+                    self._entries = read_json(self.path)
+            except Exception as e:
+                log_error(f"Failed to load LLM cache: {e}")
+        return self._entries
+
+    def get(self, key: str):
+        """
+        Look up a cached answer.
+
+        Returns:
+            The stored value, or None if missing, expired or caching is off
+        """
+        if self.ttl <= 0:
+            return None
+        entry = self._load().get(key)
+        if entry and entry[0] > time.time():
+            return entry[1]
+        return None
+
+    def put(self, key: str, value):
+        """Store an answer (must be JSON-serializable) and persist the file."""
+        if self.ttl <= 0:
+            return
+        now = time.time()
+        entries = self._load()
+        entries.pop(key, None)  # Re-insert as newest
+        entries[key] = [now + self.ttl, value]
+        # Drop expired entries, then the oldest beyond the size cap
+        live = [(k, e) for k, e in entries.items() if e[0] > now]
+        self._entries = dict(live[-self.max_entries:])
+        try:
+            atomic_write_text(self.path, json.dumps(self._entries))
+        except Exception as e:
+            log_error(f"Failed to save LLM cache: {e}")
+
+
 class GeminiClient:
     """
     Unified Gemini 3 API client for all AI operations.
@@ -2294,6 +3533,9 @@ class GeminiClient:
         
         # Initialize the Gemini client
         self.client = genai.Client(api_key=api_key)
+
+        # Saved answers for repeatable text prompts (suggestions, summaries)
+        self.cache = ResponseCache(DATA_DIR / "llm_cache.json")
         
         log(f"[GEMINI] Connected")
         log(f"   Vision: {VISION_MODEL}")
@@ -2589,63 +3831,102 @@ If no names found: {{"people": [], "context": "..."}}'''
             log_error(f"People extraction failed: {e}")
             return [], ""
 
-    def text_to_speech(self, text: str) -> bytes | None:
+    def text_to_speech(self, text: str) -> tuple[str, bytes] | None:
         """
         Convert text to speech using Gemini's audio generation.
 
         Uses Gemini 3's native TTS capability for natural-sounding speech.
-        Returns WAV audio bytes that can be played via aplay.
+        The audio is usually headerless PCM ("audio/L16;codec=pcm;rate=24000"),
+        so the MIME type is returned with it for play_wav_bytes().
 
         Args:
             text: Text to convert to speech
 
         Returns:
-            WAV audio bytes, or None on error
+            (mime_type, audio bytes), or None on error
         """
         if not text or len(text.strip()) == 0:
             return None
 
         # Limit text length for reasonable audio duration
-        if len(text) > 200:
-            text = text[:197] + "..."
+        text = _truncate(text, 200)
 
         def _do_tts():
-            response = self.client.models.generate_content(
-                model=AUDIO_MODEL,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[types.Part(text=f"Read this aloud naturally: {text}")]
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name="Kore"  # Natural female voice
-                            )
-                        )
-                    )
-                )
-            )
+            response = self.client.models.generate_content(**self._tts_request(text))
             # Extract audio data from response
             if response.candidates and response.candidates[0].content.parts:
                 for part in response.candidates[0].content.parts:
                     if hasattr(part, 'inline_data') and part.inline_data:
-                        return part.inline_data.data
+                        return part.inline_data.mime_type or "audio/wav", part.inline_data.data
             return None
 
         try:
-            audio_data = retry_api_call(_do_tts)
-            if audio_data:
-                log(f"[TTS] Generated {len(audio_data)//1024}KB audio")
-                return audio_data
+            tts = retry_api_call(_do_tts)
+            if tts and tts[1]:
+                log(f"[TTS] Generated {len(tts[1])//1024}KB audio")
+                return tts
             return None
         except Exception as e:
             log_error(f"Gemini TTS failed: {e}")
             return None
 
+    def tts_stream(self, text: str) -> Iterator[tuple[str, bytes]]:
+        """
+        Stream speech audio chunk by chunk as Gemini generates it.
+
+        Same request as text_to_speech(), sent with generate_content_stream.
+        Not retried: once chunks have been played, restarting the request
+        would repeat the start of the sentence. Errors are logged and end
+        the stream.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            (mime_type, audio bytes) per chunk, e.g. "audio/L16;codec=pcm;rate=24000"
+        """
+        if not text or len(text.strip()) == 0:
+            return
+        text = _truncate(text, 200)
+
+        total = 0
+        try:
+            for chunk in self.client.models.generate_content_stream(**self._tts_request(text)):
+                if not chunk.candidates or not chunk.candidates[0].content \
+                        or not chunk.candidates[0].content.parts:
+                    continue
+                for part in chunk.candidates[0].content.parts:
+                    if getattr(part, 'inline_data', None) and part.inline_data.data:
+                        total += len(part.inline_data.data)
+                        yield part.inline_data.mime_type or "audio/wav", part.inline_data.data
+        except Exception as e:
+            log_error(f"Gemini TTS stream failed: {e}")
+        if total:
+            log(f"[TTS] Streamed {total//1024}KB audio")
+
+    @staticmethod
+    def _tts_request(text: str) -> dict:
+        """Model, contents and config for a TTS call (shared by both TTS methods)."""
+        return dict(
+            model=AUDIO_MODEL,
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=[types.Part(text=f"Read this aloud naturally: {text}")]
+                )
+            ],
+            config=types.GenerateContentConfig(
+                response_modalities=["AUDIO"],
+                speech_config=types.SpeechConfig(
+                    voice_config=types.VoiceConfig(
+                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                            voice_name="Kore"  # Natural female voice
+                        )
+                    )
+                )
+            )
+        )
+
     # -------------------------------------------------------------------------
     # NLU: Natural Language Query Understanding
     # -------------------------------------------------------------------------
@@ -2742,14 +4023,134 @@ Return ONLY the normalized object name. Use these standard names:
         now = datetime.now()
 
         def _do_understand():
-            prompt = f'''Analyze this episodic memory query. Current time: {now.strftime("%Y-%m-%d %H:%M")}
+            prompt = self._understand_prompt(now, query)
+
+            chunks = []
+            for chunk in self.client.models.generate_content_stream(
+                model=AUDIO_MODEL,
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    temperature=0.0,
+                    response_mime_type="application/json",
+                    thinking_config=types.ThinkingConfig(
+                        thinking_level=types.ThinkingLevel.MINIMAL
+                    )
+                )
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+            return "".join(chunks).strip()
+
+        try:
+            result_text = retry_api_call(_do_understand)
+            return self._understanding(json5.loads(result_text), query)
+
+        except Exception as e:
+            log_error(f"Query understanding failed: {e}")
+            # Fallback: treat as object query with full query as entity
+            return {
+                "type": "object",
+                "entity": query.split()[-1].lower() if query else "",
+                "time_start": None,
+                "time_end": None,
+                "query": query
+            }
+
+    def understand_voice_query(self, audio_data: bytes) -> dict | None:
+        """
+        Transcribe and understand a spoken query in a single Gemini call.
+
+        Does the work of transcribe_audio() + understand_query() in one
+        request: the audio goes in with the NLU prompt, and the reply holds
+        both the transcript and the classification. Saves a full round trip
+        (TLS + model latency) on every voice search.
+
+        Args:
+            audio_data: WAV bytes (16kHz, 16-bit, mono)
+
+        Returns:
+            Same dict as understand_query() with "query" set to the transcript,
+            {"query": ""} if there was no speech, or None on error (caller
+            can fall back to the two separate calls)
+        """
+        now = datetime.now()
+
+        def _do_voice_understand():
+            chunks = []
+            for chunk in self.client.models.generate_content_stream(
+                model=AUDIO_MODEL,
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=[
+                            types.Part(text=self._understand_prompt(now)),
+                            types.Part(
+                                inline_data=types.Blob(
+                                    mime_type="audio/wav",
+                                    data=audio_data
+                                )
+                            )
+                        ]
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    temperature=0.0,
+                    response_mime_type="application/json",
+                    thinking_config=types.ThinkingConfig(
+                        thinking_level=types.ThinkingLevel.MINIMAL
+                    )
+                )
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+            return "".join(chunks).strip()
+
+        try:
+            result = json5.loads(retry_api_call(_do_voice_understand))
+            transcript = str(result.get("transcript") or "").strip()
+            log(f"[STT] \"{transcript}\"")
+            if not transcript or transcript == "[silence]":
+                return {"query": ""}
+            return self._understanding(result, transcript)
+
+        except Exception as e:
+            log_error(f"Voice query understanding failed: {e}")
+            return None
+
+    @staticmethod
+    def _understand_prompt(now: datetime, query: str | None = None) -> str:
+        """
+        NLU prompt for understand_query() / understand_voice_query().
+
+        Args:
+            now: Current time, for resolving relative time expressions
+            query: Query text, or None when the query is attached as audio
+                   (the reply then also carries a "transcript" field)
+        """
+        if query is None:
+            head = f'''Analyze this spoken episodic memory query (attached audio). Current time: {now.strftime("%Y-%m-%d %H:%M")}
+
+Transcribe the speech, then classify the query type and extract relevant information.
+If there is no speech, return {{"transcript": "[silence]"}}. Otherwise return JSON:
+
+{{
+  "transcript": "the words spoken",
+'''
+        else:
+            head = f'''Analyze this episodic memory query. Current time: {now.strftime("%Y-%m-%d %H:%M")}
 
 Query: "{query}"
 
 Classify the query type and extract relevant information. Return JSON:
 
 {{
-  "type": "object|scene|time|person|near|activity|vqa",
+'''
+        return head + f'''  "type": "object|scene|time|person|near|activity|vqa",
   "entity": "extracted name or empty string",
   "question": "the visual question if type=vqa, else null",
   "placed": true or false,
@@ -2809,59 +4210,26 @@ Examples:
 - "how many boxes are there?" → {{"type":"vqa","entity":"boxes","question":"how many boxes are there?","placed":false,"time_start":null,"time_end":null}}
 - "what brand is the laptop?" → {{"type":"vqa","entity":"laptop","question":"what brand is the laptop?","placed":false,"time_start":null,"time_end":null}}'''
 
-            chunks = []
-            for chunk in self.client.models.generate_content_stream(
-                model=AUDIO_MODEL,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[types.Part(text=prompt)]
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    temperature=0.0,
-                    response_mime_type="application/json",
-                    thinking_config=types.ThinkingConfig(
-                        thinking_level=types.ThinkingLevel.MINIMAL
-                    )
-                )
-            ):
-                if chunk.text:
-                    chunks.append(chunk.text)
-            return "".join(chunks).strip()
-
-        try:
-            result_text = retry_api_call(_do_understand)
-            result = json5.loads(result_text)
-
-            # Ensure required fields
-            query_type = result.get("type", "object")
-            entity = result.get("entity", "")
-            time_start = result.get("time_start")
-            time_end = result.get("time_end")
-
-            log(f"[NLU] \"{query}\" → type={query_type}, entity=\"{entity}\"")
-            if time_start:
-                log(f"   Time: {time_start} to {time_end}")
-
-            return {
-                "type": query_type,
-                "entity": entity.lower().strip() if entity else "",
-                "time_start": time_start,
-                "time_end": time_end,
-                "query": query
-            }
-
-        except Exception as e:
-            log_error(f"Query understanding failed: {e}")
-            # Fallback: treat as object query with full query as entity
-            return {
-                "type": "object",
-                "entity": query.split()[-1].lower() if query else "",
-                "time_start": None,
-                "time_end": None,
-                "query": query
-            }
+    @staticmethod
+    def _understanding(result: dict, query: str) -> dict:
+        """Normalize a parsed NLU reply into the dict understand_query() returns."""
+        # Ensure required fields
+        query_type = result.get("type", "object")
+        entity = result.get("entity", "")
+        time_start = result.get("time_start")
+        time_end = result.get("time_end")
+
+        log(f"[NLU] \"{query}\" → type={query_type}, entity=\"{entity}\"")
+        if time_start:
+            log(f"   Time: {time_start} to {time_end}")
+
+        return {
+            "type": query_type,
+            "entity": entity.lower().strip() if entity else "",
+            "time_start": time_start,
+            "time_end": time_end,
+            "query": query
+        }
 
     def suggest_locations(self, obj_name: str, context: str = "") -> list[str]:
         """
@@ -2877,6 +4245,12 @@ Examples:
         Returns:
             List of 3-5 suggested locations to check
         """
+        cache_key = f"suggest|{obj_name.lower()}|{context}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            log(f"[SUGGEST] {obj_name} → {cached[:3]} (cached)")
+            return cached
+
         def _do_suggest():
             prompt = f'''Where might someone find their {obj_name}?
 
@@ -2913,6 +4287,8 @@ Example for "keys": ["front door hook", "kitchen counter", "coat pocket", "desk"
             suggestions = json5.loads(result_text)
             if isinstance(suggestions, list):
                 log(f"[SUGGEST] {obj_name} → {suggestions[:3]}")
+                if suggestions:
+                    self.cache.put(cache_key, suggestions[:5])
                 return suggestions[:5]
             return []
         except Exception as e:
@@ -3061,12 +4437,16 @@ Reply in 2 sentences: where it is and how it got there.""")]
         # Limit to 10 memories to keep prompt size reasonable on Pi Zero
         memory_summaries = []
         for mem in memories[:10]:
-            time_str = mem.timestamp[11:16] if len(mem.timestamp) > 16 else mem.timestamp
-            objs = ", ".join(mem.object_names()[:4]) or "no objects"
-            memory_summaries.append(f"- {time_str} at {mem.location}: {objs}")
+            memory_summaries.append(mem.summary_line())
 
         memories_text = "\n".join(memory_summaries)
 
+        # Same period over the same memories → same summary
+        cache_key = f"summary|{time_period}|{','.join(m.id for m in memories[:10])}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         def _do_summary():
             chunks = []
             for chunk in self.client.models.generate_content_stream(
@@ -3097,6 +4477,7 @@ Use friendly, easy-to-understand language.""")]
         try:
             result = retry_api_call(_do_summary)
             if result:
+                self.cache.put(cache_key, result)
                 return result
             # Fallback if empty response
             locations = list(set(m.location for m in memories[:5]))
@@ -3119,7 +4500,7 @@ Use friendly, easy-to-understand language.""")]
 # Search capabilities:
 #   - find_by_object():     O(1) hash lookup + fuzzy plural/compound matching
 #   - find_by_location():   Partial string match on scene location
-#   - find_by_time():       Datetime window filtering (fuzzy time expressions)
+#   - find_by_time():       Binary search on a sorted timeline (fuzzy time expressions)
 #   - find_cooccurrence():  Objects seen in the same memory frame
 #
 # Memory lifecycle:
@@ -3137,19 +4518,19 @@ class MemoryIndex:
     ┌─────────────────────────────────────────────────────────────────────┐
     │  by_object (Hash Index)           memories (Metadata Cache)         │
     │  ─────────────────────            ─────────────────────             │
-    │  "keys"    → {mem_001, mem_005}   mem_001 → {location, objects...}  │
-    │  "wallet"  → {mem_002, mem_003}   mem_002 → {location, objects...}  │
-    │  "phone"   → {mem_001, mem_004}   mem_003 → {location, objects...}  │
+    │  "keys"    → [mem_001, mem_005]   mem_001 → {location, objects...}  │
+    │  "wallet"  → [mem_002, mem_003]   mem_002 → {location, objects...}  │
+    │  "phone"   → [mem_001, mem_004]   mem_003 → {location, objects...}  │
     │                                                                      │
     │  by_person (Hash Index) - WHO dimension of episodic memory          │
     │  ───────────────────────                                             │
-    │  "john"    → {mem_002, mem_005}   (memories where John was present) │
-    │  "sarah"   → {mem_003}            (memories where Sarah was present)│
+    │  "john"    → [mem_002, mem_005]   (memories where John was present) │
+    │  "sarah"   → [mem_003]            (memories where Sarah was present)│
     └─────────────────────────────────────────────────────────────────────┘
 
     ALGORITHM FOR SEARCH:
     1. Query: "keys"
-    2. Lookup in by_object hash: O(1) → {mem_001, mem_005}
+    2. Lookup in by_object hash: O(1) → [mem_001, mem_005]
     3. Return newest memory ID (sorted by timestamp)
     4. Load full memory from disk if needed
 
@@ -3182,29 +4563,77 @@ class MemoryIndex:
         """
         self.gemini = gemini
 
-        # Hash index: object_name → set of memory IDs containing that object
+        # Hash index: object_name → sorted list of memory IDs containing that object
         # Enables O(1) lookup: "Where are my keys?" → instantly find memories
-        self.by_object: dict[str, set] = {}
+        # Posting lists are kept sorted (IDs are timestamp-prefixed), so
+        # newest-first results are a reverse slice instead of a sort.
+        self.by_object: dict[str, list[str]] = {}
 
-        # Hash index: person_name → set of memory IDs where person was present
+        # Hash index: person_name → sorted list of memory IDs where person was present
         # Enables O(1) lookup for WHO dimension: "Who did I meet?" queries
-        self.by_person: dict[str, set] = {}
+        self.by_person: dict[str, list[str]] = {}
 
-        # Hash index: activity → set of memory IDs where activity occurred
+        # Hash index: activity → sorted list of memory IDs where activity occurred
         # Enables O(1) lookup: "Did I take medication?" → find memories with that activity
-        self.by_activity: dict[str, set] = {}
-
-        # Metadata cache: memory_id → {location, objects, timestamp, ...}
+        self.by_activity: dict[str, list[str]] = {}
+
+        # Pre-split index keys: key → tuple of words, filled on first insert.
+        # The fuzzy fallbacks compare query words against key words; keeping
+        # the split form here avoids re-running key.split() on every query.
+        self._object_key_tokens: dict[str, tuple[str, ...]] = {}
+        self._person_key_tokens: dict[str, tuple[str, ...]] = {}
+        self._activity_key_tokens: dict[str, tuple[str, ...]] = {}
+
+        # Vocabulary: lowercased keys of audio names / activities. Lets
+        # person/activity queries run their substring filter once over this
+        # small set instead of over every loaded memory; the spellings shown
+        # come from the matched memories' own rows.
+        # Only audio names go in person_vocab (visual descriptions aren't names).
+        self.person_vocab: set[str] = set()
+        self.activity_vocab: set[str] = set()
+
+        # Metadata cache: memory_id → MemoryMeta(location, objects, timestamp, ...)
         # Avoids disk reads for common operations
-        self.memories: dict[str, dict] = {}
+        self.memories: dict[str, MemoryMeta] = {}
 
         # Access tracking: memory_id → {access_count, last_accessed}
         # Used for smart cleanup - frequently accessed memories survive longer
         self.access_log: dict[str, dict] = {}
 
+        # Pending accesses not yet folded into access_log:
+        # memory_id → [extra_count, last_accessed_epoch]. record_access() only
+        # bumps these counters; save() drains them, so searches never pay for
+        # timestamp formatting or dict rewrites per hit.
+        self._access_buffer: dict[str, list] = {}
+
+        # Sorted timeline: (timestamp_ns, mem_id) in chronological order.
+        # Time-window queries binary-search this instead of scanning every
+        # memory: O(log N + k) rather than O(N). Keys are ints, so each probe
+        # is an integer compare rather than a string compare. Derived from
+        # self.memories, so it is rebuilt on load rather than persisted.
+        self._timeline: list[tuple[int, str]] = []
+
+        # LRU cache for time-window queries: (start_ts, end_ts, n) → memory IDs
+        # "What did I do this morning?" is often asked repeatedly in a session.
+        # Cleared whenever the set of memories changes (add/reload/cleanup).
+        self._time_cache: OrderedDict[tuple, list] = OrderedDict()
+
         # Persistence file path
         self.index_file = MEMORY_DIR / "memory_index.json"
 
+        # Append-only journal of record_access() hits between full saves:
+        # one JSON line {mem_id: [count, last_accessed_epoch]} per query.
+        # Folded into access_log on load/save. save() moves it aside to
+        # access_folding under a flock and removes that only once the index
+        # holds its lines, so appends made during the index write survive.
+        # Kept in DATA_DIR so appends don't touch MEMORY_DIR's mtime.
+        self.access_journal = DATA_DIR / "access_log.jsonl"
+        self.access_folding = DATA_DIR / "access_log.jsonl.folding"
+        self._journal_offset = 0  # Bytes of the journal already folded in
+
+        # On-disk state as of the last load (see reload_if_changed)
+        self._disk_stamp = self._disk_state()
+
         # Load existing index from disk
         self._load()
         log(f"[INDEX] {len(self.memories)} memories loaded")
@@ -3214,30 +4643,18 @@ class MemoryIndex:
         # Try loading from index file first
         if self.index_file.exists():
             try:
-                data = json5.loads(self.index_file.read_text())
-                self.memories = data.get("memories", {})
+                data = read_json(self.index_file)
+                self.memories = {
+                    mem_id: MemoryMeta.from_dict(meta)
+                    for mem_id, meta in data.get("memories", {}).items()
+                }
                 self.access_log = data.get("access_log", {})
-                # Rebuild object index
+                self._replay_folding_leftover()
+                self._journal_offset = 0
+                self._replay_access_journal()
+                # Rebuild object/person/activity indexes from cached metadata
                 for mem_id, meta in self.memories.items():
-                    for obj in meta.get('objects', '').split(','):
-                        obj = obj.strip().lower()
-                        if obj:
-                            self.by_object.setdefault(obj, set()).add(mem_id)
-                    # Rebuild person index (WHO dimension - audio names)
-                    for person in meta.get('people', '').split(','):
-                        person = person.strip().lower()
-                        if person:
-                            self.by_person.setdefault(person, set()).add(mem_id)
-                    # Rebuild visual person index (WHO dimension - visual)
-                    for person_desc in meta.get('persons', '').split(';'):
-                        person_desc = person_desc.strip().lower()
-                        if person_desc:
-                            self.by_person.setdefault(person_desc, set()).add(mem_id)
-                    # Rebuild activity index (WHAT dimension)
-                    for activity in meta.get('activities', '').split(','):
-                        activity = activity.strip().lower()
-                        if activity:
-                            self.by_activity.setdefault(activity, set()).add(mem_id)
+                    self._index_meta(mem_id, meta)
                 if self.memories:
                     return  # Index loaded successfully
             except Exception as e:
@@ -3254,68 +4671,393 @@ class MemoryIndex:
 
         for path in MEMORY_DIR.glob("mem_*.json"):
             try:
-                data = json5.loads(path.read_text())
+                data = read_json(path)
                 mem_id = data.get("id", path.stem)
                 if mem_id in self.memories:
                     continue  # Already in index
 
                 # Add to index
-                objs = [o.get("name", "") for o in data.get("objects", [])]
+                raw_objs = [o for o in data.get("objects", []) if o.get("name")]
+                objs = [o["name"] for o in raw_objs]
                 people = data.get("people", [])
                 activities = data.get("activities", [])
                 persons = data.get("persons", [])
                 # Extract visual person descriptions
                 person_descs = [p.get("description", "") for p in persons if isinstance(p, dict)]
-                self.memories[mem_id] = {
-                    "timestamp": data.get("timestamp", ""),
-                    "location": data.get("location", "unknown"),
-                    "objects": ",".join(objs),
-                    "people": ",".join(people) if people else "",
-                    "persons": ";".join(person_descs) if person_descs else "",
-                    "activities": ",".join(activities) if activities else "",
-                    "image_path": str(MEMORY_DIR / f"{mem_id}.jpg"),
-                    "tags": ",".join(data.get("tags", [])),
-                    "relationships": ";".join(data.get("relationships", [])),
-                    "description": data.get("description", ""),
-                    "audio_transcript": data.get("audio_transcript", ""),
-                    "conversation_context": data.get("conversation_context", "")
-                }
+                self.memories[mem_id] = MemoryMeta(
+                    timestamp=data.get("timestamp", ""),
+                    location=data.get("location", "unknown"),
+                    objects=objs,
+                    object_flags=[object_context_flags(o.get("context", "")) for o in raw_objs],
+                    people=list(people),
+                    persons=[d for d in person_descs if d],
+                    activities=list(activities),
+                    image_path=str(MEMORY_DIR / f"{mem_id}.jpg"),
+                    tags=list(data.get("tags", [])),
+                    relationships=list(data.get("relationships", [])),
+                    description=data.get("description", ""),
+                    audio_transcript=data.get("audio_transcript", ""),
+                    conversation_context=data.get("conversation_context", ""),
+                )
 
-                # Update object index
-                for obj in objs:
-                    obj = obj.strip().lower()
-                    if obj:
-                        self.by_object.setdefault(obj, set()).add(mem_id)
-
-                # Update person index (WHO dimension - audio names)
-                for person in people:
-                    person = person.strip().lower()
-                    if person:
-                        self.by_person.setdefault(person, set()).add(mem_id)
-
-                # Update visual person index (WHO dimension - visual)
-                for person_desc in person_descs:
-                    person_desc = person_desc.strip().lower()
-                    if person_desc:
-                        self.by_person.setdefault(person_desc, set()).add(mem_id)
-
-                # Update activity index (WHAT dimension)
-                for activity in activities:
-                    activity = activity.strip().lower()
-                    if activity:
-                        self.by_activity.setdefault(activity, set()).add(mem_id)
+                self._index_meta(mem_id, self.memories[mem_id])
             except Exception:
                 pass  # Skip malformed files
 
+    def _index_meta(self, mem_id: str, meta: MemoryMeta) -> None:
+        """
+        Add one metadata row to the object, person and activity indexes.
+
+        Shared by _load(), _rebuild_from_files() and add() so the
+        rebuild logic lives in exactly one place.
+
+        Keys are interned: thousands of memories share the same few
+        tokens ("keys", "kitchen"), so one string object each saves
+        RAM on the Pi Zero and lets dict lookups compare by identity.
+
+        Args:
+            mem_id: Memory ID the row belongs to
+            meta: Metadata row for the memory
+        """
+        meta.location = sys.intern(meta.location)
+
+        # Timeline (WHEN dimension) - only rows with a parseable timestamp
+        if meta.ts_epoch:
+            entry = (meta.timestamp_ns, mem_id)
+            timeline = self._timeline
+            if not timeline or timeline[-1] < entry:
+                timeline.append(entry)  # Common case: newest capture
+            else:
+                i = bisect_left(timeline, entry)
+                if i == len(timeline) or timeline[i] != entry:
+                    timeline.insert(i, entry)
+
+        # Object index (WHAT dimension)
+        for obj in meta.objects:
+            obj = sys.intern(obj.strip().lower())
+            if obj:
+                self._post(self.by_object, obj, mem_id, self._object_key_tokens)
+
+        # Person index (WHO dimension - audio names)
+        for name in meta.people:
+            person = sys.intern(name.strip().lower())
+            if person:
+                self._post(self.by_person, person, mem_id, self._person_key_tokens)
+                self.person_vocab.add(person)
+
+        # Visual person index (WHO dimension - visual descriptions)
+        for person_desc in meta.persons:
+            person_desc = sys.intern(person_desc.strip().lower())
+            if person_desc:
+                self._post(self.by_person, person_desc, mem_id, self._person_key_tokens)
+
+        # Activity index (WHAT dimension - actions)
+        for name in meta.activities:
+            activity = sys.intern(name.strip().lower())
+            if activity:
+                self._post(self.by_activity, activity, mem_id, self._activity_key_tokens)
+                self.activity_vocab.add(activity)
+
+    def _unindex_meta(self, mem_id: str, meta: MemoryMeta) -> None:
+        """
+        Remove one memory from the object/person/activity indexes.
+
+        The inverse of _index_meta() for the hash indexes (the caller
+        handles the timeline). Keys whose posting list empties are dropped,
+        along with their split form and vocabulary entry.
+        """
+        for obj in meta.objects:
+            obj = obj.strip().lower()
+            if obj:
+                self._unpost(self.by_object, obj, mem_id, self._object_key_tokens)
+        for name in chain(meta.people, meta.persons):
+            person = name.strip().lower()
+            if person and self._unpost(self.by_person, person, mem_id, self._person_key_tokens):
+                self.person_vocab.discard(person)
+        for name in meta.activities:
+            activity = name.strip().lower()
+            if activity and self._unpost(self.by_activity, activity, mem_id,
+                                         self._activity_key_tokens):
+                self.activity_vocab.discard(activity)
+
+    @staticmethod
+    def _post(index: dict[str, list[str]], key: str, mem_id: str,
+              tokens: dict[str, tuple[str, ...]] | None = None) -> None:
+        """
+        Insert a memory ID into a sorted posting list, skipping duplicates.
+
+        Memory IDs embed their capture timestamp, so new captures almost
+        always belong at the end of the list and this is a plain append.
+        Out-of-order inserts (e.g. rebuilding from files) fall back to bisect.
+
+        Args:
+            index: One of by_object / by_person / by_activity
+            key: Normalized index key (object, person or activity)
+            mem_id: Memory ID to add
+            tokens: Matching *_key_tokens dict; new keys get their split form
+        """
+        ids = index.get(key)
+        if ids is None:
+            ids = index[key] = []
+            if tokens is not None:
+                tokens[key] = tuple(key.split())
+        if not ids or ids[-1] < mem_id:
+            ids.append(mem_id)
+            return
+        i = bisect_left(ids, mem_id)
+        if i == len(ids) or ids[i] != mem_id:
+            ids.insert(i, mem_id)
+
+    @staticmethod
+    def _unpost(index: dict[str, list[str]], key: str, mem_id: str,
+                tokens: dict[str, tuple[str, ...]] | None = None) -> bool:
+        """
+        Remove a memory ID from a sorted posting list if present.
+
+        A list left empty is deleted with its key (and its entry in tokens),
+        so keys of forgotten memories don't linger in the index.
+
+        Returns:
+            True if the key was dropped
+        """
+        ids = index.get(key)
+        if ids is None:
+            return False
+        i = bisect_left(ids, mem_id)
+        if i < len(ids) and ids[i] == mem_id:
+            del ids[i]
+        if ids:
+            return False
+        del index[key]
+        if tokens is not None:
+            tokens.pop(key, None)
+        return True
+
+    @staticmethod
+    def _newest_first(posts: list[list[str]], n: int | None = None) -> list[str]:
+        """
+        Union sorted posting lists into one deduplicated, newest-first list.
+
+        Each list is already sorted, so heapq.merge walks them in a single
+        pass; duplicates come out adjacent and are dropped as we go. When
+        only the top-n results are needed the merge stops as soon as n
+        unique IDs have been produced.
+
+        Args:
+            posts: Sorted (ascending) posting lists to combine
+            n: Maximum results to return (None = all)
+
+        Returns:
+            Memory IDs, newest first, without duplicates
+        """
+        if not posts:
+            return []
+        if len(posts) == 1:
+            ids = posts[0]
+            return ids[::-1] if n is None else ids[:-n - 1:-1]
+        result = []
+        for mem_id in heapq.merge(*(reversed(p) for p in posts), reverse=True):
+            if not result or result[-1] != mem_id:
+                result.append(mem_id)
+                if len(result) == n:
+                    break
+        return result
+
+    def _flush_access(self):
+        """Fold buffered record_access() hits into access_log."""
+        for mem_id, (count, last_ts) in self._access_buffer.items():
+            entry = self.access_log.setdefault(mem_id, {"access_count": 0, "last_accessed": ""})
+            entry["access_count"] += count
+            entry["last_accessed"] = datetime.fromtimestamp(last_ts).isoformat()
+        self._access_buffer.clear()
+
+    def _open_journal_locked(self, mode: str):
+        """
+        Open the live access journal with an exclusive flock held.
+
+        save() renames the journal aside, so a handle opened just before
+        the rename can point at the old file: re-open until the locked file
+        is still the one at the path. The lock is released on close.
+
+        Args:
+            mode: "a" to append (creates the journal), "rb" to read
+
+        Returns:
+            Locked file object, or None if the journal doesn't exist ("rb")
+        """
+        while True:
+            try:
+                f = open(self.access_journal, mode)
+            except FileNotFoundError:
+                return None
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                if os.stat(self.access_journal).st_ino == os.fstat(f.fileno()).st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            f.close()
+
+    def _replay_folding_leftover(self):
+        """
+        Fold in a side file left behind by a save that didn't finish.
+
+        If it's older than the index, the index write completed and only
+        the unlink was missed, so its lines are already counted: drop it.
+        """
+        folding_ns = mtime_ns(self.access_folding)
+        if not folding_ns:
+            return
+        if folding_ns <= mtime_ns(self.index_file):
+            self.access_folding.unlink(missing_ok=True)
+            return
+        try:
+            self._fold_journal_bytes(self.access_folding.read_bytes())
+        except OSError as e:
+            log_error(f"Failed to read access journal: {e}")
+
+    def _replay_access_journal(self):
+        """
+        Fold journal lines written since the last replay into access_log.
+
+        The search process appends to the journal while the daemon owns
+        full saves, so the daemon replays it before writing the index.
+        A torn last line (crash mid-append) is skipped.
+        """
+        try:
+            with open(self.access_journal, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() < self._journal_offset:
+                    self._journal_offset = 0  # Compacted and restarted since
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            self._journal_offset = 0
+            return
+        except OSError as e:
+            log_error(f"Failed to read access journal: {e}")
+            return
+        self._journal_offset += self._fold_journal_bytes(data)
+
+    def _fold_journal_bytes(self, data: bytes) -> int:
+        """
+        Fold complete journal lines from data into access_log.
+
+        Args:
+            data: Raw journal bytes
+
+        Returns:
+            Number of bytes consumed (up to the last complete line)
+        """
+        used = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # Incomplete write; pick it up next time
+            used += len(line)
+            try:
+                hits = json.loads(line)
+            except ValueError:
+                try:
+                    hits = json5.loads(line.decode())  # Line written by json5.dumps
+                except Exception:
+                    continue
+            for mem_id, (count, last_ts) in hits.items():
+                entry = self.access_log.setdefault(mem_id, {"access_count": 0, "last_accessed": ""})
+                entry["access_count"] += count
+                entry["last_accessed"] = datetime.fromtimestamp(last_ts).isoformat()
+        return used
+
+    def _set_journal_aside(self):
+        """
+        Fold the rest of the live journal and move it to access_folding.
+
+        Done under the journal lock, so no append lands between the last
+        read and the rename; later appends start a fresh journal.
+        """
+        f = self._open_journal_locked("rb")
+        if f is None:
+            return
+        with f:
+            f.seek(self._journal_offset)
+            self._fold_journal_bytes(f.read())
+            if self.access_folding.exists():
+                # Side file from an unfinished save (folded in on load): add to it
+                f.seek(0)
+                with open(self.access_folding, "ab") as side:
+                    side.write(f.read())
+                    side.flush()
+                    os.fsync(side.fileno())
+                os.unlink(self.access_journal)
+            else:
+                os.replace(self.access_journal, self.access_folding)
+        self._journal_offset = 0
+
+    def save_access(self):
+        """
+        Persist buffered record_access() hits without rewriting the index.
+
+        Appends one line to the access journal (a few dozen bytes, one
+        fsync) instead of re-serializing every memory row. The next full
+        save() folds the journal into memory_index.json.
+        """
+        if not self._access_buffer:
+            return
+        line = json.dumps(self._access_buffer) + "\n"
+        try:
+            with self._open_journal_locked("a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                end = f.tell()
+        except OSError as e:
+            log_error(f"Failed to append access journal: {e}")
+            return  # Hits stay buffered for the next save()
+        # Our own line is already counted once we fold the buffer below
+        if end - len(line.encode()) == self._journal_offset:
+            self._journal_offset = end
+        self._flush_access()
+
     def _save(self):
         """Save memory index to JSON file."""
+        self.write_snapshot(self.snapshot())
+
+    def snapshot(self) -> str:
+        """
+        Serialize the index for write_snapshot(), without writing it.
+
+        The in-memory half of save(): folds pending access hits in and
+        renders the JSON. The daemon's persist thread calls this under
+        persist_lock and does the (slow, fsync'd) write after releasing it.
+
+        Returns:
+            Index file contents
+        """
         try:
-            atomic_write_text(self.index_file, json5.dumps({
-                "memories": self.memories,
-                "access_log": self.access_log
-            }, indent=2))
+            self._set_journal_aside()
+        except OSError as e:
+            log_error(f"Failed to fold access journal: {e}")
+        self._flush_access()
+        # Strict JSON: read_json parses it with a C parser on the next
+        # load (json5's pure-Python parser takes seconds on a big index)
+        return json.dumps({
+            "memories": {mem_id: meta.to_dict() for mem_id, meta in self.memories.items()},
+            "access_log": self.access_log
+        }, indent=2)
+
+    def write_snapshot(self, text: str):
+        """
+        Write a snapshot() to the index file. Touches no in-memory state.
+
+        Args:
+            text: Output of snapshot()
+        """
+        try:
+            atomic_write_text(self.index_file, text)
         except Exception as e:
             log_error(f"Failed to save index: {e}")
+            return
+        # Side file is now folded into the index
+        self.access_folding.unlink(missing_ok=True)
 
     def add(self, memory: Memory, save_now: bool = False):
         """
@@ -3326,47 +5068,20 @@ class MemoryIndex:
             save_now: If True, persist to disk immediately.
                       If False, call save() later to batch writes.
         """
-        # Extract visual person descriptions for indexing
-        person_descs = [p.get("description", "") for p in memory.persons if isinstance(p, dict)]
-        meta = {
-            "timestamp": memory.timestamp,
-            "location": memory.location,
-            "objects": ",".join(memory.object_names()),
-            "activities": ",".join(memory.activities) if memory.activities else "",
-            "people": ",".join(memory.people) if memory.people else "",
-            "persons": ";".join(person_descs) if person_descs else "",
-            "image_path": memory.image_path,
-            "tags": ",".join(memory.tags) if memory.tags else "",
-            "relationships": ";".join(memory.relationships) if memory.relationships else "",
-            "description": memory.description,
-            "audio_transcript": memory.audio_transcript,
-            "conversation_context": memory.conversation_context
-        }
+        meta = MemoryMeta.from_memory(memory)
 
-        # Update hash index for objects (WHAT dimension)
+        # Update hash indexes (objects, activities, people, visual persons)
         self.memories[memory.id] = meta
-        for obj in memory.objects:
-            self.by_object.setdefault(obj.name.lower(), set()).add(memory.id)
-
-        # Update hash index for activities (WHAT dimension - actions)
-        for activity in memory.activities:
-            self.by_activity.setdefault(activity.lower(), set()).add(memory.id)
+        self._time_cache.clear()  # New memory may fall inside a cached window
+        self._index_meta(memory.id, meta)
 
-        # Update hash index for people (WHO dimension - audio names)
-        for person in memory.people:
-            self.by_person.setdefault(person.lower(), set()).add(memory.id)
-
-        # Update hash index for visual persons (WHO dimension - visual)
-        # Index both descriptions and names (if linked)
+        # Visual persons linked to an audio name are also findable by name
+        # (the name isn't part of the stored row, so index it here)
         for person_info in memory.persons:
-            # Index by name if available (linked from audio)
-            if person_info.get("name"):
-                self.by_person.setdefault(person_info["name"].lower(), set()).add(memory.id)
-            # Also index by description keywords (e.g., "blue shirt", "glasses")
-            desc = person_info.get("description", "")
-            if desc:
-                # Index the full description for "person in blue shirt" queries
-                self.by_person.setdefault(desc.lower(), set()).add(memory.id)
+            if isinstance(person_info, dict) and person_info.get("name"):
+                name = sys.intern(person_info["name"].strip().lower())
+                if name:
+                    self._post(self.by_person, name, memory.id, self._person_key_tokens)
 
         # Optionally persist to disk (for batched writes, call save() separately)
         if save_now:
@@ -3377,12 +5092,42 @@ class MemoryIndex:
         """Persist index to disk. Call periodically for batched writes."""
         self._save()
 
+    def _disk_state(self) -> tuple[int, int]:
+        """
+        (memory dir mtime, index file mtime) in nanoseconds.
+
+        The daemon writes memory files immediately and the index in batches,
+        both by temp file + rename in MEMORY_DIR, so any write (or cleanup
+        delete) changes this tuple.
+        """
+        return (mtime_ns(MEMORY_DIR), mtime_ns(self.index_file))
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload only if the daemon wrote or deleted anything since last load.
+
+        Returns:
+            True if the index was reloaded
+        """
+        if self._disk_state() == self._disk_stamp:
+            return False
+        self.reload()
+        return True
+
     def reload(self):
         """Reload index from disk to pick up new memories from daemon."""
+        self._disk_stamp = self._disk_state()  # Stat before reading (see TemporalGraph.load)
         self.by_object.clear()
         self.by_activity.clear()
         self.by_person.clear()
         self.memories.clear()
+        self._object_key_tokens.clear()
+        self._person_key_tokens.clear()
+        self._activity_key_tokens.clear()
+        self.person_vocab.clear()
+        self.activity_vocab.clear()
+        self._timeline.clear()
+        self._time_cache.clear()
         self._load()
         # Also scan for new JSON files not yet in the index
         # (daemon saves individual files immediately but batches index writes)
@@ -3406,17 +5151,22 @@ class MemoryIndex:
         get a higher decay score and survive cleanup longer, mimicking how
         human memory strengthens through recall.
 
+        Hits are buffered in memory and folded into access_log on the next
+        save(), so a search costs a couple of dict updates, not a rewrite.
+
         Args:
             mem_ids: List of memory IDs that were returned in a search
         """
-        now = datetime.now().isoformat()
+        now = time.time()
+        buffer = self._access_buffer
         for mem_id in mem_ids:
-            # Initialize access entry if this is the first retrieval
-            if mem_id not in self.access_log:
-                self.access_log[mem_id] = {"access_count": 0, "last_accessed": now}
-            # Increment counter and update timestamp on each retrieval
-            self.access_log[mem_id]["access_count"] += 1
-            self.access_log[mem_id]["last_accessed"] = now
+            pending = buffer.get(mem_id)
+            if pending is None:
+                buffer[mem_id] = [1, now]
+            else:
+                # Increment counter and update timestamp on each retrieval
+                pending[0] += 1
+                pending[1] = now
 
     def decay_score(self, mem_id: str) -> float:
         """
@@ -3449,7 +5199,8 @@ class MemoryIndex:
         # Newer memories are more valuable. Uses e^(-lambda * t) where
         # lambda = ln(2)/half_life. Half-life of 7 days means a memory
         # loses half its recency score every week.
-        ts_str = self.memories.get(mem_id, {}).get("timestamp", "")
+        meta = self.memories.get(mem_id)
+        ts_str = meta.timestamp if meta else ""
         try:
             ts = datetime.fromisoformat(ts_str)
             age_days = (now - ts).total_seconds() / 86400.0
@@ -3461,14 +5212,17 @@ class MemoryIndex:
         # Each search hit adds +0.1 to the score (max +1.0).
         # This means a memory searched 10+ times is as "strong" as
         # a brand-new memory, even if it's weeks old.
+        # Count includes hits still waiting in the access buffer.
         access = self.access_log.get(mem_id, {})
-        retrieval_boost = min(access.get("access_count", 0) * 0.1, 1.0)
+        pending = self._access_buffer.get(mem_id)
+        access_count = access.get("access_count", 0) + (pending[0] if pending else 0)
+        retrieval_boost = min(access_count * 0.1, 1.0)
 
         return recency + retrieval_boost
 
     def search(self, query: str, n: int = 5) -> list[str]:
         """Search by object name (partial match)."""
-        return self.find_by_object(query)[:n]
+        return self.find_by_object(query, n)
 
     # Synonym dictionary: maps alternative names to canonical names
     OBJECT_SYNONYMS = {
@@ -3523,8 +5277,20 @@ class MemoryIndex:
         if canonical not in SYNONYM_GROUPS:
             SYNONYM_GROUPS[canonical] = {canonical}
 
-    def find_by_object(self, name: str) -> list[str]:
-        """Fast O(1) lookup by object name with controlled fuzzy matching and synonym support."""
+    def find_by_object(self, name: str, n: int | None = None,
+                       with_flags: bool = False) -> list:
+        """Fast O(1) lookup by object name with controlled fuzzy matching and synonym support.
+
+        Args:
+            name: Object name to search for (case-insensitive)
+            n: Maximum results to return (None = all matches)
+            with_flags: If True, return (mem_id, context_flags) pairs so callers
+                        can filter on object context without loading memories
+
+        Returns:
+            List of memory IDs containing the object, newest first
+            (or list of (mem_id, flags) tuples when with_flags=True)
+        """
         name = name.lower().strip()
 
         # Expand search terms to include synonyms
@@ -3541,29 +5307,57 @@ class MemoryIndex:
             search_terms.update(self.SYNONYM_GROUPS[name])
 
         # Try exact match first for all search terms (O(1) hash lookup)
-        matches = set()
-        for term in search_terms:
-            if term in self.by_object:
-                matches.update(self.by_object[term])
-
-        if matches:
-            return sorted(matches, reverse=True)
-
-        # Controlled fuzzy match: only allow plural/singular variants and
-        # compound word matches to avoid false positives (e.g. "car" should
-        # NOT match "card" or "cartoon", but "key" SHOULD match "keys").
-        for key, ids in self.by_object.items():
-            for term in search_terms:
-                # Allow plural/singular: "key"↔"keys", "glass"↔"glasses"
-                if key.rstrip("s") == term.rstrip("s"):
-                    matches.update(ids)
-                # Allow compound words: "water bottle" matches "bottle"
-                elif term in key.split() or key in term.split():
-                    matches.update(ids)
-
-        return sorted(matches, reverse=True)
-
-    def find_by_person(self, name: str) -> list[str]:
+        posts = [self.by_object[term] for term in search_terms if term in self.by_object]
+
+        if not posts:
+            # Controlled fuzzy match: only allow plural/singular variants and
+            # compound word matches to avoid false positives (e.g. "car" should
+            # NOT match "card" or "cartoon", but "key" SHOULD match "keys").
+            # Query-side forms are computed once; key-side words come pre-split.
+            term_forms = [(term, term.rstrip("s"), term.split()) for term in search_terms]
+            key_tokens = self._object_key_tokens
+            for key, ids in self.by_object.items():
+                key_stem = key.rstrip("s")
+                words = key_tokens.get(key) or tuple(key.split())
+                for term, term_stem, term_words in term_forms:
+                    # Allow plural/singular: "key"↔"keys", "glass"↔"glasses"
+                    if key_stem == term_stem:
+                        posts.append(ids)
+                        break
+                    # Allow compound words: "water bottle" matches "bottle"
+                    elif term in words or key in term_words:
+                        posts.append(ids)
+                        break
+
+        mem_ids = self._newest_first(posts, n)
+        if with_flags:
+            return [(mem_id, self.context_flags(mem_id, name)) for mem_id in mem_ids]
+        return mem_ids
+
+    def context_flags(self, mem_id: str, name: str) -> int | None:
+        """
+        Look up the stored context bits for an object in one memory.
+
+        Uses the same partial match as Memory.find_object(), so "key"
+        resolves to the first object named like "car keys".
+
+        Args:
+            mem_id: Memory ID to inspect
+            name: Object name (lowercased)
+
+        Returns:
+            _FLAG_* bitmask (0 if the object isn't found), or None if the
+            row predates stored flags and the caller must check on disk
+        """
+        meta = self.memories.get(mem_id)
+        if meta is None or len(meta.object_flags) != len(meta.objects):
+            return None
+        for obj_lower, flags in zip(meta.objects_lower, meta.object_flags):
+            if name in obj_lower:
+                return flags
+        return 0
+
+    def find_by_person(self, name: str, n: int | None = None) -> list[str]:
         """
         Fast O(1) lookup by person name for WHO dimension of episodic memory.
 
@@ -3572,6 +5366,7 @@ class MemoryIndex:
         Args:
             name: Person name to search for (case-insensitive)
                   If empty string, returns all memories with people
+            n: Maximum results to return (None = all matches)
 
         Returns:
             List of memory IDs where person was present, newest first
@@ -3580,27 +5375,76 @@ class MemoryIndex:
 
         # If no name specified, return all memories that have people
         if not name:
-            matches = set()
-            for person_name, mem_ids in self.by_person.items():
-                matches.update(mem_ids)
-            return sorted(matches, reverse=True)
+            return self._newest_first(list(self.by_person.values()), n)
 
         # Try exact match first (O(1) hash lookup)
         if name in self.by_person:
-            return sorted(self.by_person[name], reverse=True)
+            return self._newest_first([self.by_person[name]], n)
 
         # Fuzzy match: partial name matching
         # "john" matches "john smith", "dr. john", etc.
-        matches = set()
+        posts = []
+        first_name = name.split()[0]
+        key_tokens = self._person_key_tokens
         for key, ids in self.by_person.items():
             # Allow partial match: "john" matches "john smith"
             if name in key or key in name:
-                matches.update(ids)
+                posts.append(ids)
+                continue
             # Allow first name match: "john" matches "john"
-            if name.split()[0] == key.split()[0]:
-                matches.update(ids)
+            words = key_tokens.get(key) or tuple(key.split())
+            if words and words[0] == first_name:
+                posts.append(ids)
+
+        return self._newest_first(posts, n)
+
+    def match_people(self, entity: str, mem_ids: list[str]) -> list[str]:
+        """
+        List the people (audio names) relevant to a person query.
+
+        Args:
+            entity: Person searched for ("" = anyone)
+            mem_ids: Memories returned for the query
+
+        Returns:
+            Names as originally recorded, e.g. ["John", "Sarah"]
+        """
+        return self._match_vocab(self.person_vocab, entity, mem_ids,
+                                 lambda meta: meta.people)
+
+    def match_activities(self, entity: str, mem_ids: list[str]) -> list[str]:
+        """
+        List the activities relevant to an activity query.
+
+        Args:
+            entity: Activity searched for ("" = any activity)
+            mem_ids: Memories returned for the query
 
-        return sorted(matches, reverse=True)
+        Returns:
+            Activities as originally recorded, e.g. ["taking medication"]
+        """
+        return self._match_vocab(self.activity_vocab, entity, mem_ids,
+                                 lambda meta: meta.activities)
+
+    def _match_vocab(self, vocab: set[str], entity: str,
+                     mem_ids: list[str], field_of) -> list[str]:
+        """
+        Shared body of match_people / match_activities.
+
+        The substring filter runs once over the (small) vocabulary to get
+        the matching keys; each returned memory's cached metadata row is
+        then checked by set membership. No memory is read from disk.
+        """
+        entity = entity.lower().strip()
+        allowed = {key for key in vocab if entity in key} if entity else None
+        found: dict[str, None] = {}  # Ordered set
+        for mem_id in mem_ids:
+            meta = self.memories.get(mem_id)
+            if meta:
+                for name in field_of(meta):
+                    if allowed is None or name.strip().lower() in allowed:
+                        found[name] = None
+        return list(found)
 
     def get_all_people(self) -> list[str]:
         """
@@ -3614,7 +5458,7 @@ class MemoryIndex:
         """
         return list(self.by_person.keys())
 
-    def find_by_activity(self, activity: str) -> list[str]:
+    def find_by_activity(self, activity: str, n: int | None = None) -> list[str]:
         """
         Fast lookup by activity for WHAT dimension (actions) of episodic memory.
 
@@ -3624,6 +5468,7 @@ class MemoryIndex:
         Args:
             activity: Activity to search for (e.g., "taking medication", "medication")
                       If empty string, returns all memories with activities
+            n: Maximum results to return (None = all matches)
 
         Returns:
             List of memory IDs where activity occurred, newest first
@@ -3632,29 +5477,28 @@ class MemoryIndex:
 
         # If no activity specified, return all memories that have activities
         if not activity:
-            matches = set()
-            for act_name, mem_ids in self.by_activity.items():
-                matches.update(mem_ids)
-            return sorted(matches, reverse=True)
+            return self._newest_first(list(self.by_activity.values()), n)
 
         # Try exact match first (O(1) hash lookup)
         if activity in self.by_activity:
-            return sorted(self.by_activity[activity], reverse=True)
+            return self._newest_first([self.by_activity[activity]], n)
 
         # Fuzzy match: partial activity matching
         # "medication" matches "taking medication", "medication reminder", etc.
-        matches = set()
+        posts = []
+        activity_words = set(activity.split())
+        key_tokens = self._activity_key_tokens
         for key, ids in self.by_activity.items():
             # Allow partial match: "medication" matches "taking medication"
             if activity in key or key in activity:
-                matches.update(ids)
+                posts.append(ids)
+                continue
             # Allow keyword match: any word in activity matches
-            activity_words = set(activity.split())
-            key_words = set(key.split())
-            if activity_words & key_words:  # Intersection
-                matches.update(ids)
+            words = key_tokens.get(key) or tuple(key.split())
+            if not activity_words.isdisjoint(words):  # Intersection
+                posts.append(ids)
 
-        return sorted(matches, reverse=True)
+        return self._newest_first(posts, n)
 
     def get_all_activities(self) -> list[str]:
         """
@@ -3684,11 +5528,17 @@ class MemoryIndex:
         Returns:
             List of memory IDs matching the location, newest first
         """
-        location = location.lower()
+        location = location.lower().strip()
         matches = []
+        # Only a handful of distinct locations exist, so test each once
+        verdicts: dict[str, bool] = {}
         for mem_id, meta in self.memories.items():
-            mem_loc = meta.get("location", "").lower()
-            if location in mem_loc or mem_loc in location:
+            raw_loc = meta.location
+            hit = verdicts.get(raw_loc)
+            if hit is None:
+                mem_loc = raw_loc.lower()
+                hit = verdicts[raw_loc] = location in mem_loc or mem_loc in location
+            if hit:
                 matches.append(mem_id)
         return sorted(matches, reverse=True)[:n]
 
@@ -3701,11 +5551,15 @@ class MemoryIndex:
     # parse_time_entity() from fuzzy natural language expressions.
     # -------------------------------------------------------------------------
 
+    # Maximum number of time-window results kept in the LRU cache
+    TIME_CACHE_SIZE = 32
+
     def find_by_time(self, start: datetime, end: datetime, n: int = 20) -> list[str]:
         """
         Find memories within a time window.
 
         Enables temporal queries like "what did I see this morning?"
+        Thin wrapper over find_by_time_ns() for datetime callers.
 
         Args:
             start: Window start (inclusive)
@@ -3715,21 +5569,48 @@ class MemoryIndex:
         Returns:
             List of memory IDs within the time window, newest first
         """
-        matches = []
-        for mem_id, meta in self.memories.items():
-            ts_str = meta.get("timestamp", "")
-            if not ts_str:
-                continue
-            try:
-                # Parse ISO timestamp and check if it falls within the window
-                ts = datetime.fromisoformat(ts_str)
-                if start <= ts <= end:
-                    matches.append(mem_id)
-            except (ValueError, TypeError):
-                # Skip memories with invalid timestamps
-                continue
-        # Return newest first (memory IDs embed timestamps, so reverse sort works)
-        return sorted(matches, reverse=True)[:n]
+        return self.find_by_time_ns(epoch_ns(start.timestamp()), epoch_ns(end.timestamp()), n)
+
+    def find_by_time_ns(self, start_ns: int, end_ns: int, n: int = 20) -> list[str]:
+        """
+        Find memories within a time window given as epoch nanoseconds.
+
+        Uses binary search on the sorted timeline, so cost is O(log N + k)
+        no matter how many memories are stored, and every comparison is
+        between ints. Results are also cached per (start, end, n) window
+        (to the second), so repeating the same time question during a
+        session is served straight from a dict.
+
+        Args:
+            start_ns: Window start (inclusive), see epoch_ns()
+            end_ns: Window end (inclusive)
+            n: Maximum results to return
+
+        Returns:
+            List of memory IDs within the time window, newest first
+        """
+        key = (start_ns // 1_000_000_000, end_ns // 1_000_000_000, n)
+        cached = self._time_cache.get(key)
+        if cached is not None:
+            self._time_cache.move_to_end(key)  # Mark as most recently used
+            return list(cached)
+
+        # The window is a contiguous slice of the timeline. (end, "\uffff")
+        # sorts after every entry stamped exactly at `end`, keeping the end
+        # inclusive.
+        timeline = self._timeline
+        lo = bisect_left(timeline, (start_ns,))
+        hi = bisect_right(timeline, (end_ns, "\uffff"))
+
+        # Return newest first, walking back from the end of the window
+        result = [mem_id for _, mem_id in timeline[max(lo, hi - n):hi]]
+        result.reverse()
+
+        # Remember this window, evicting the least recently used entry
+        self._time_cache[key] = result
+        if len(self._time_cache) > self.TIME_CACHE_SIZE:
+            self._time_cache.popitem(last=False)
+        return list(result)
 
     # -------------------------------------------------------------------------
     # Co-occurrence Search (spatial context)
@@ -3740,7 +5621,7 @@ class MemoryIndex:
     # No extra storage needed — uses the existing objects CSV in metadata.
     # -------------------------------------------------------------------------
 
-    def find_cooccurrence(self, entity: str, n: int = 10) -> list[tuple[str, list[str]]]:
+    def find_cooccurrence(self, entity: str, n: int = 10) -> tuple[list[str], list[tuple[str, list[str]]]]:
         """
         Find objects that appeared in the same memory as the given entity.
 
@@ -3751,23 +5632,66 @@ class MemoryIndex:
             n: Maximum results to return
 
         Returns:
-            List of (memory_id, [co-occurring object names]) tuples, newest first
+            (mem_ids, cooccurrences) where mem_ids are the newest n memories
+            containing the entity and cooccurrences is a list of
+            (memory_id, [co-occurring object names]) tuples, newest first.
+            Returning mem_ids lets callers skip a second find_by_object().
         """
         entity_lower = entity.lower().strip()
-        # First, find all memories containing the queried entity
-        mem_ids = self.find_by_object(entity_lower)
+        entity_stem = entity_lower.rstrip("s")
+        # First, find the newest memories containing the queried entity
+        mem_ids = self.find_by_object(entity_lower, n)
         results = []
-        for mem_id in mem_ids[:n]:
-            meta = self.memories.get(mem_id, {})
-            # Split the comma-separated object list from metadata
-            all_objs = [o.strip() for o in meta.get("objects", "").split(",") if o.strip()]
+        for mem_id in mem_ids:
+            meta = self.memories.get(mem_id)
+            if not meta:
+                continue
             # Exclude the queried entity itself (including plural/singular variants)
-            others = [o for o in all_objs if o.lower() != entity_lower
-                       and o.lower().rstrip("s") != entity_lower.rstrip("s")]
+            others = []
+            for obj, obj_lower in zip(meta.objects, meta.objects_lower):
+                if obj_lower != entity_lower and obj_lower.rstrip("s") != entity_stem:
+                    others.append(obj)
             if others:
                 results.append((mem_id, others))
-        return results
-
+        return mem_ids, results
+
+
+# Relative numeric time expressions, compiled once at import.
+# ASCII-only classes ([0-9], [ \t]) keep the patterns small: query text
+# comes from our own classifier, never from Unicode digits or spaces.
+_RE_LAST_HOURS = re.compile(r'(?:last|past)[ \t]+([0-9]+)[ \t]+hours?')
+_RE_LAST_MINUTES = re.compile(r'(?:last|past)[ \t]+([0-9]+)[ \t]+minutes?')
+
+# Literal time phrases → window builder taking (now, today_start).
+# Day-part expressions use conventional boundaries that align with how
+# people naturally divide their day. One dict lookup replaces an if-chain.
+_PHRASE_TABLE: dict[str, Callable[[datetime, datetime], tuple[datetime, datetime]]] = {
+    # 6 AM to noon
+    "this morning": lambda now, today: (today.replace(hour=6), today.replace(hour=12)),
+    # Noon to 6 PM
+    "this afternoon": lambda now, today: (today.replace(hour=12), today.replace(hour=18)),
+    # 6 PM to end of day
+    "this evening": lambda now, today: (today.replace(hour=18), today.replace(hour=23, minute=59, second=59)),
+    "tonight": lambda now, today: (today.replace(hour=18), today.replace(hour=23, minute=59, second=59)),
+    # Midnight to current time
+    "today": lambda now, today: (today, now),
+    # Full previous day (midnight to midnight)
+    "yesterday": lambda now, today: (today - timedelta(days=1), today),
+    # Rolling 60-minute window ending now
+    "last hour": lambda now, today: (now - timedelta(hours=1), now),
+    "past hour": lambda now, today: (now - timedelta(hours=1), now),
+    # 8 PM yesterday to 6 AM today (sleep period)
+    "last night": lambda now, today: ((today - timedelta(days=1)).replace(hour=20), today.replace(hour=6)),
+}
+
+# Unit word (singular) → timedelta keyword for "last N <unit>" phrases
+_TIME_UNITS = {"hour": "hours", "minute": "minutes"}
+
+
+@functools.lru_cache(maxsize=4)
+def _midnight(day: date) -> datetime:
+    """Midnight at the start of `day` (cached: only changes once a day)."""
+    return datetime(day.year, day.month, day.day)
 
 
 def parse_time_entity(entity: str) -> tuple[datetime, datetime]:
@@ -3796,50 +5720,34 @@ def parse_time_entity(entity: str) -> tuple[datetime, datetime]:
         (start, end) datetime tuple defining the time window
     """
     now = datetime.now()
-    # Midnight today — anchor point for day-relative expressions
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     entity = entity.lower().strip()
 
     # --- Relative numeric expressions: "last N hours", "past 30 minutes" ---
-    # These must be checked first because they use regex with \d+ groups,
-    # and would be missed by the keyword-based checks below.
-    m = re.match(r'(?:last|past)\s+(\d+)\s+hours?', entity)
+    # Split once and dispatch on the unit word; covers the common
+    # three-word form without running any regex. Only needs `now`.
+    parts = entity.split()
+    if len(parts) == 3 and parts[0] in ("last", "past") and parts[1].isascii() and parts[1].isdigit():
+        unit = _TIME_UNITS.get(parts[2].rstrip("s"))
+        if unit:
+            return now - timedelta(**{unit: int(parts[1])}), now
+
+    # --- Literal phrases: "this morning", "yesterday", "last night" ... ---
+    build = _PHRASE_TABLE.get(entity)
+    if build is not None:
+        # Midnight today — anchor point for day-relative expressions
+        return build(now, _midnight(now.date()))
+
+    # Looser forms ("last 2 hours ago") still go through the regexes
+    m = _RE_LAST_HOURS.match(entity)
     if m:
         hours = int(m.group(1))
         return now - timedelta(hours=hours), now
 
-    m = re.match(r'(?:last|past)\s+(\d+)\s+minutes?', entity)
+    m = _RE_LAST_MINUTES.match(entity)
     if m:
         minutes = int(m.group(1))
         return now - timedelta(minutes=minutes), now
 
-    # --- Day-part expressions: fixed time boundaries ---
-    # Morning/afternoon/evening use conventional boundaries that align
-    # with how people naturally divide their day.
-    if entity == "this morning":
-        # 6 AM to noon
-        return today_start.replace(hour=6), today_start.replace(hour=12)
-    elif entity == "this afternoon":
-        # Noon to 6 PM
-        return today_start.replace(hour=12), today_start.replace(hour=18)
-    elif entity in ("this evening", "tonight"):
-        # 6 PM to end of day
-        return today_start.replace(hour=18), today_start.replace(hour=23, minute=59, second=59)
-    elif entity == "today":
-        # Midnight to current time
-        return today_start, now
-    elif entity == "yesterday":
-        # Full previous day (midnight to midnight)
-        yesterday = today_start - timedelta(days=1)
-        return yesterday, today_start
-    elif entity in ("last hour", "past hour"):
-        # Rolling 60-minute window ending now
-        return now - timedelta(hours=1), now
-    elif entity == "last night":
-        # 8 PM yesterday to 6 AM today (sleep period)
-        yesterday = today_start - timedelta(days=1)
-        return yesterday.replace(hour=20), today_start.replace(hour=6)
-
     # Fallback: if expression is unrecognized, default to last 24 hours
     return now - timedelta(hours=24), now
 
@@ -3856,10 +5764,114 @@ def parse_time_entity(entity: str) -> tuple[datetime, datetime]:
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Gemini box_2d coordinates are on a 0-1000 scale. Boxes are divided by this
+# in float64 (rather than multiplied by 0.001 in float32) so stored values
+# stay exactly what float(v) / 1000.0 produced, e.g. 0.07 not 0.07000000000000001.
+_BBOX_SCALE = 1000.0
+_FULL_FRAME_BOX = (0, 0, 1000, 1000)  # Fallback when box_2d is missing/invalid
+
+# 3x3 grid cell names, indexed [row][col] (same cells as BoundingBox.position)
+_GRID_NAMES = (
+    ("top-left", "top", "top-right"),
+    ("left", "center", "right"),
+    ("bottom-left", "bottom", "bottom-right"),
+)
+
+
+def normalize_boxes(raw_boxes: list) -> np.ndarray:
+    """
+    Convert a frame's Gemini boxes to normalized coordinates in one pass.
+
+    All boxes go into a single (N, 4) array (one row per detection) so
+    scaling, clamping and the axis swap are a few vector ops per frame
+    instead of per-object Python arithmetic.
+
+    Args:
+        raw_boxes: N boxes as [ymin, xmin, ymax, xmax] on a 0-1000 scale
+
+    Returns:
+        float64 array of shape (N, 4) as [x1, y1, x2, y2], clamped to 0.0-1.0
+    """
+    arr = np.asarray(raw_boxes, dtype=np.float64).reshape(-1, 4) / _BBOX_SCALE
+    np.clip(arr, 0.0, 1.0, out=arr)   # Model can return out-of-range values
+    return arr[:, [1, 0, 3, 2]]       # Y-first (Gemini) → X-first (BoundingBox)
+
+
+def box_positions(boxes_xyxy: np.ndarray) -> list[str]:
+    """
+    Vectorized BoundingBox.position() for a whole (N, 4) box array.
+
+    Args:
+        boxes_xyxy: Array from normalize_boxes()
+
+    Returns:
+        Grid position name per row ("top-left", "center", ...)
+    """
+    cx = (boxes_xyxy[:, 0] + boxes_xyxy[:, 2]) / 2
+    cy = (boxes_xyxy[:, 1] + boxes_xyxy[:, 3]) / 2
+    # 0 = left/top, 1 = center/middle, 2 = right/bottom. Written as
+    # "not < 0.33" so NaN lands in the middle cell, like position() does.
+    col = (~(cx < 0.33)).astype(np.intp) + (cx > 0.66)
+    row = (~(cy < 0.33)).astype(np.intp) + (cy > 0.66)
+    return [_GRID_NAMES[r][c] for r, c in zip(row.tolist(), col.tolist())]
+
+
+def _normalize_detections_loop(boxes: np.ndarray, conf: np.ndarray,
+                               min_conf: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Scalar version of normalize_detections(), written for numba.njit."""
+    n = boxes.shape[0]
+    xyxy = np.empty((n, 4))
+    conf_out = np.empty(n)
+    keep = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        # Y-first (Gemini) → X-first, scaled and clamped (NaN passes through)
+        for j, src in enumerate((1, 0, 3, 2)):
+            v = boxes[i, src] / _BBOX_SCALE
+            xyxy[i, j] = 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+        # Same result as max(0.0, min(1.0, c)), including NaN → 1.0
+        c = conf[i] if conf[i] < 1.0 else 1.0
+        c = c if c > 0.0 else 0.0
+        conf_out[i] = c
+        keep[i] = c >= min_conf
+    return xyxy, conf_out, keep
+
+
+if NUMBA_AVAILABLE:
+    _normalize_detections_jit = njit(cache=True)(_normalize_detections_loop)
+
+
+def normalize_detections(raw_boxes: list, confidences: list[float],
+                         min_conf: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Normalize a frame's boxes and confidences and mark which to keep.
+
+    Only numbers go in - names and contexts stay in Python. Uses a compiled
+    loop when numba is installed, otherwise NumPy vector ops; both give
+    identical results.
+
+    Args:
+        raw_boxes: N boxes as [ymin, xmin, ymax, xmax] on a 0-1000 scale
+        confidences: N raw confidence values (already converted to float)
+        min_conf: Detections below this confidence are not kept
+
+    Returns:
+        (boxes_xyxy, confidences, keep): (N, 4) boxes as in normalize_boxes(),
+        confidences clamped to 0.0-1.0, and a boolean keep mask
+    """
+    boxes = np.asarray(raw_boxes, dtype=np.float64).reshape(-1, 4)
+    conf = np.asarray(confidences, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _normalize_detections_jit(boxes, conf, min_conf)
+    conf = np.where(conf < 1.0, conf, 1.0)
+    conf = np.where(conf > 0.0, conf, 0.0)
+    return normalize_boxes(boxes), conf, conf >= min_conf
+
+
 def analyze_and_store(gemini: GeminiClient, index: MemoryIndex,
                       temporal: TemporalGraph, image_data: bytes,
                       capture_ts: datetime | None = None,
-                      audio_data: bytes | None = None) -> tuple[Memory, bool]:
+                      audio_data: bytes | None = None,
+                      lock: 'threading.Lock | None' = None) -> tuple[Memory, bool]:
     """
     Full capture-to-storage pipeline with audio for episodic memory.
 
@@ -3886,10 +5898,15 @@ def analyze_and_store(gemini: GeminiClient, index: MemoryIndex,
         capture_ts: When the frame was captured (important for accurate tracking!)
                     If None, uses current time (less accurate)
         audio_data: Optional WAV audio bytes captured during the scene
+        lock: Held only while the temporal graph and index are mutated
+              (the daemon's persist_lock), never across Gemini calls or
+              file writes, so a background save doesn't wait on the network
 
     Returns:
         Tuple of (Memory, was_saved): Memory object and whether it was saved
     """
+    guard = lock or contextlib.nullcontext()
+
     # STEP 1: Analyze image with Gemini Vision
     # NOTE: This API call may take 14-40+ seconds on free tier
     analysis = gemini.analyze_image(image_data)
@@ -3953,109 +5970,128 @@ def analyze_and_store(gemini: GeminiClient, index: MemoryIndex,
                 memory.persons[i]["name"] = name
             log(f"[WHO-LINKED] Names linked to visual persons")
 
+    # Nothing detected at all (blank wall, covered lens): skip the whole
+    # object pipeline. Attached objects are still checked for removal,
+    # since "nothing visible" means they aren't visible either.
+    objects = analysis.get("objects") or []
+    if not objects:
+        with guard:
+            removed_attached = temporal.check_removed_attached(frozenset(), memory.timestamp,
+                                                               timeout_seconds=30)
+        for removed_obj in removed_attached:
+            log(f"[REMOVED] {removed_obj} was removed (was attached, now not visible)")
+        log("[SKIP] No objects detected")
+        return (memory, False)  # Return (memory, was_saved=False)
+
     # STEP 3: Process detected objects and update temporal graph
     movements_detected = 0
     useful_object_count = 0  # Track non-attached objects
+    visible_names: set[str] = set()  # Every detection, for removed-attached check
+    announcements: list[str] = []  # Spoken after the graph update (TTS is a network call)
+
+    # Parse every bounding box in the frame at once from Gemini's native
+    # box_2d format: [ymin, xmin, ymax, xmax] on a 0-1000 scale.
+    #   e.g., [120, 50, 450, 300] means:
+    #     ymin=120/1000=0.12, xmin=50/1000=0.05,
+    #     ymax=450/1000=0.45, xmax=300/1000=0.30
+    # normalize_detections() scales, clamps to 0.0-1.0 and swaps to our
+    # X-first order (x1, y1, x2, y2), clamps confidences and applies
+    # MIN_CONFIDENCE; box_positions() does the 3x3 grid lookup for all rows.
+    # Invalid boxes fall back to the full image.
+    raw_boxes = []
+    raw_confidences = []
+    for obj in objects:
+        box = obj.get("box_2d", _FULL_FRAME_BOX)
+        raw_boxes.append(box if len(box) == 4 else _FULL_FRAME_BOX)
+        raw_confidences.append(float(obj.get("confidence", 1.0)))
+    boxes_xyxy, confidences, keep = normalize_detections(
+        raw_boxes, raw_confidences, MIN_CONFIDENCE)
+    positions = box_positions(boxes_xyxy)
+
+    # Graph updates only under the lock; announcements and file writes follow it
+    with guard:
+        for obj, (x1, y1, x2, y2), confidence, kept, position in zip(
+                objects, boxes_xyxy.tolist(), confidences.tolist(), keep.tolist(), positions):
+            # Read every field we need once (Gemini uses "label"; older prompts
+            # used "name"), so the rest of the loop works on locals
+            name = obj.get("label") or obj.get("name") or "?"
+            name_lower = name.lower()
+            attached = obj.get("attached", False)
+            visible_names.add(name_lower)
+
+            # Filter out low-confidence detections (likely hallucinations)
+            if not kept:
+                log(f"[VISION] Skipping low-confidence detection: {name} ({confidence:.0%})")
+                continue
 
-    for obj in analysis["objects"]:
-        # Parse bounding box from Gemini's native box_2d format.
-        # Gemini returns [ymin, xmin, ymax, xmax] on a 0-1000 scale.
-        #   e.g., [120, 50, 450, 300] means:
-        #     ymin=120/1000=0.12, xmin=50/1000=0.05,
-        #     ymax=450/1000=0.45, xmax=300/1000=0.30
-        # NOTE: Gemini uses Y-first order (ymin, xmin, ymax, xmax), but
-        # our BoundingBox uses X-first order (x1, y1, x2, y2) - so we swap.
-        # We clamp to 0.0-1.0 because model can return out-of-range values.
-        box = obj.get("box_2d", [0, 0, 1000, 1000])
-        if len(box) == 4:
-            # Divide by 1000 to convert from 0-1000 → 0.0-1.0
-            ymin, xmin, ymax, xmax = [float(v) / 1000.0 for v in box]
-        else:
-            # Fallback: full image if box format is invalid
-            ymin, xmin, ymax, xmax = 0.0, 0.0, 1.0, 1.0
-        confidence = max(0.0, min(1.0, float(obj.get("confidence", 1.0))))
-
-        # Filter out low-confidence detections (likely hallucinations)
-        if confidence < MIN_CONFIDENCE:
-            obj_name = obj.get("label", obj.get("name", "?"))
-            log(f"[VISION] Skipping low-confidence detection: {obj_name} ({confidence:.0%})")
-            continue
-
-        bbox = BoundingBox(
-            name=obj.get("label", obj.get("name", "?")),
-            x1=max(0.0, min(1.0, xmin)),   # Clamp left edge to valid range
-            y1=max(0.0, min(1.0, ymin)),   # Clamp top edge to valid range
-            x2=max(0.0, min(1.0, xmax)),   # Clamp right edge to valid range
-            y2=max(0.0, min(1.0, ymax)),   # Clamp bottom edge to valid range
-            confidence=confidence,
-            context=obj.get("context", "")
-        )
-        memory.objects.append(bbox)
-
-        # Check if Gemini marked this object as attached to person
-        # (glasses on face, watch on wrist, headphones worn - these move with the person)
-        # Gemini decides based on world knowledge, not hardcoded phrases
-        is_attached = obj.get("attached", False)
-
-        if is_attached:
-            # Mark as attached for removal detection later
-            temporal.mark_attached(bbox.name, memory.timestamp, memory.location)
-            # Still record last seen, but don't track movement
-            temporal.last_seen[bbox.name] = (memory.location, bbox.position(),
-                                             memory.timestamp, memory.id)
-            continue
-
-        # This is a useful (non-attached) object
-        useful_object_count += 1
-
-        # Update temporal graph - this detects movements (CAUSE AND EFFECT)
-        movement = temporal.update(
-            obj_name=bbox.name,
-            location=memory.location,
-            position=bbox.position(),
-            timestamp=memory.timestamp,
-            memory_id=memory.id
-        )
-        if movement:
-            movements_detected += 1
-
-            # Proactive announcement: tell user when important object is placed
-            # This helps prevent forgetting where you just put something
-            if ANNOUNCE_ENABLED and bbox.name.lower() in ANNOUNCE_OBJECTS:
-                obj_lower = bbox.name.lower()
-                now = time.time()
-                last_announced = _announcement_cooldowns.get(obj_lower, 0)
-
-                # Only announce if cooldown has passed
-                if now - last_announced > ANNOUNCE_COOLDOWN:
-                    _announcement_cooldowns[obj_lower] = now
-                    announcement = f"{bbox.name} placed on {memory.location}"
-                    log(f"[ANNOUNCE] {announcement}")
-
-                    # TTS: Speak the announcement using Gemini TTS (non-blocking)
-                    try:
-                        if TTS_ENABLED:
-                            audio_data = gemini.text_to_speech(announcement)
-                            if audio_data:
-                                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                                    f.write(audio_data)
-                                    temp_path = f.name
-                                # Play and cleanup in background
-                                subprocess.Popen(
-                                    f"aplay -D plughw:0,0 -q {temp_path} && rm {temp_path}",
-                                    shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                                )
-                    except Exception:
-                        pass  # TTS failure shouldn't block memory capture
+            bbox = BoundingBox(
+                name=name,
+                x1=x1,   # Edges already clamped to 0.0-1.0 above
+                y1=y1,
+                x2=x2,
+                y2=y2,
+                confidence=confidence,
+                context=obj.get("context", "")
+            )
+            memory.objects.append(bbox)
+
+            # Check if Gemini marked this object as attached to person
+            # (glasses on face, watch on wrist, headphones worn - these move with the person)
+            # Gemini decides based on world knowledge, not hardcoded phrases
+            if attached:
+                # Mark as attached for removal detection later
+                temporal.mark_attached(name, memory.timestamp, memory.location)
+                # Still record last seen, but don't track movement
+                temporal.last_seen[name] = (memory.location, position,
+                                            memory.timestamp, memory.id)
+                continue
 
-    # Check if any previously-attached objects have been removed
-    # (e.g., glasses that were on face but now not seen at all)
-    all_visible = [obj.get("label", obj.get("name", "")) for obj in analysis["objects"]]
-    removed_attached = temporal.check_removed_attached(all_visible, memory.timestamp, timeout_seconds=30)
+            # This is a useful (non-attached) object
+            useful_object_count += 1
+
+            # Update temporal graph - this detects movements (CAUSE AND EFFECT)
+            movement = temporal.update(
+                obj_name=name,
+                location=memory.location,
+                position=position,
+                timestamp=memory.timestamp,
+                memory_id=memory.id
+            )
+            if movement:
+                movements_detected += 1
+
+                # Proactive announcement: tell user when important object is placed
+                # This helps prevent forgetting where you just put something
+                if ANNOUNCE_ENABLED and name_lower in ANNOUNCE_OBJECTS:
+                    now = time.time()
+                    last_announced = _announcement_cooldowns.get(name_lower, 0)
+
+                    # Only announce if cooldown has passed
+                    if now - last_announced > ANNOUNCE_COOLDOWN:
+                        _announcement_cooldowns[name_lower] = now
+                        announcement = f"{name} placed on {memory.location}"
+                        log(f"[ANNOUNCE] {announcement}")
+                        announcements.append(announcement)  # Spoken below, outside the lock
+
+        # Check if any previously-attached objects have been removed
+        # (e.g., glasses that were on face but now not seen at all)
+        removed_attached = temporal.check_removed_attached(visible_names, memory.timestamp, timeout_seconds=30)
     for removed_obj in removed_attached:
         log(f"[REMOVED] {removed_obj} was removed (was attached, now not visible)")
         # When the object reappears NOT attached, it will be saved as a normal memory
 
+    # TTS: Speak announcements using Gemini TTS (non-blocking playback)
+    for announcement in announcements:
+        try:
+            if TTS_ENABLED:
+                tts = gemini.text_to_speech(announcement)
+                if tts:
+                    # Play in background (no temp file)
+                    mime_type, audio_data = tts
+                    play_wav_bytes(audio_data, mime_type=mime_type)
+        except Exception:
+            pass  # TTS failure shouldn't block memory capture
+
     # Check if there are any useful (non-attached) objects
     if useful_object_count == 0:
         log(f"[SKIP] No useful objects (only attached: {', '.join(memory.object_names())})")
@@ -4066,7 +6102,8 @@ def analyze_and_store(gemini: GeminiClient, index: MemoryIndex,
     save_metadata(memory)
 
     # STEP 6: Add to search index (don't persist yet - batched in daemon loop)
-    index.add(memory, save_now=False)
+    with guard:
+        index.add(memory, save_now=False)
 
     # NOTE: Temporal graph and index are saved periodically by the daemon
     # loop to reduce disk I/O. Also saved on graceful shutdown.
@@ -4135,13 +6172,12 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
     # Returns a LIST of Memory objects (unlike other paths which return one).
     if query_type == "time":
         start, end = parse_time_entity(search_entity)
-        mem_ids = index.find_by_time(start, end)
+        mem_ids = index.find_by_time(start, end, n=10)
         if mem_ids:
             # Reinforce top 5 results (user is recalling this time period)
             index.record_access(mem_ids[:5])
         # Load up to 10 memories (cap to avoid loading too many into RAM)
-        memories = [load_memory(mid) for mid in mem_ids[:10]]
-        memories = [m for m in memories if m is not None]
+        memories = _take_valid(mem_ids, 10)
         return memories, []
 
     # --- PATH 2: NEAR / CO-OCCURRENCE QUERY ---
@@ -4149,8 +6185,7 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
     # Finds the entity itself AND all objects that shared a memory frame.
     # Returns (Memory, List[(mem_id, [co-occurring objects])]).
     if query_type == "near":
-        cooccurrences = index.find_cooccurrence(search_entity)
-        mem_ids = index.find_by_object(search_entity)
+        mem_ids, cooccurrences = index.find_cooccurrence(search_entity)
         memory = load_memory(mem_ids[0]) if mem_ids else None
         if mem_ids:
             index.record_access(mem_ids[:1])
@@ -4164,18 +6199,11 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
         mem_ids = index.find_by_person(search_entity)
         if mem_ids:
             index.record_access(mem_ids[:5])
-        # Load memories and collect all people mentioned
-        memories = [load_memory(mid) for mid in mem_ids[:10]]
-        memories = [m for m in memories if m is not None]
-        # Collect unique people from these memories
-        people_found = set()
-        for mem in memories:
-            if mem.people:
-                people_found.update(mem.people)
-        # If searching for specific person, filter to just that person
-        if search_entity:
-            people_found = {p for p in people_found if search_entity.lower() in p.lower()}
-        return memories, list(people_found)
+        memories = _take_valid(mem_ids, 10)
+        # People heard in the returned memories (matching the search, if any),
+        # resolved from cached index rows rather than the loaded memories
+        people_found = index.match_people(search_entity, [m.id for m in memories])
+        return memories, people_found
 
     # --- PATH 2.75: ACTIVITY QUERY (WHAT dimension - actions) ---
     # "did I take my medication?", "did I eat breakfast?", "did I lock the door?"
@@ -4186,16 +6214,10 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
         if mem_ids:
             index.record_access(mem_ids[:5])
         # Load memories with matching activities
-        memories = [load_memory(mid) for mid in mem_ids[:10]]
-        memories = [m for m in memories if m is not None]
-        # Collect matching activities from these memories
-        activities_found = set()
-        for mem in memories:
-            if mem.activities:
-                for act in mem.activities:
-                    if not search_entity or search_entity.lower() in act.lower():
-                        activities_found.add(act)
-        return memories, list(activities_found)
+        memories = _take_valid(mem_ids, 10)
+        # Matching activities come from the index vocabulary (see match_activities)
+        activities_found = index.match_activities(search_entity, [m.id for m in memories])
+        return memories, activities_found
 
     # --- PATH 2.8: VQA QUERY (Visual Question Answering) ---
     # "what color is the chair?", "how many boxes?", "what brand is the laptop?"
@@ -4209,10 +6231,11 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
         if mem_ids:
             index.record_access(mem_ids[:1])
             memory = load_memory(mem_ids[0])
-            if memory and memory.image_data:
+            image = memory.image_bytes() if memory else b""
+            if image:
                 # Ask Gemini Vision the question about this image
                 vqa_question = question if question else query
-                answer = gemini.answer_visual_question(memory.image_data, vqa_question)
+                answer = gemini.answer_visual_question(image, vqa_question)
                 return memory, answer
         return None, "Object not found in memory."
 
@@ -4232,34 +6255,47 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
     # "where are my keys?", "find my wallet", "keys"
     # Core O(1) hash lookup + temporal movement history for cause-and-effect.
     # This is the primary episodic memory use case.
-    mem_ids = index.find_by_object(search_entity)
+    if placed:
+        # Also fetch each hit's stored context flags (see MemoryMeta.object_flags)
+        flagged = index.find_by_object(search_entity, with_flags=True)
+        mem_ids = [mid for mid, _ in flagged]
+    else:
+        mem_ids = index.find_by_object(search_entity)
 
     # HUMAN-LIKE EPISODIC MEMORY: When user asks "where did I LEAVE my X?"
     # they want to know where they PUT IT DOWN, not where they were HOLDING it.
-    # Filter out "in hand" memories when placed=True.
+    # Filter out "in hand" memories when placed=True. The filter runs on the
+    # in-RAM flags, so normally only the memory we finally show is read from
+    # disk; a candidate whose file can't be loaded is skipped for the next.
     if placed and mem_ids:
-        IN_HAND_CONTEXTS = ["in hand", "held", "holding", "carrying", "gripping"]
-        placed_mem_ids = []
-        in_hand_memory = None  # Keep track of "in hand" memory for fallback
-
-        for mid in mem_ids:
-            mem = load_memory(mid)
-            if mem:
+        in_hand = []  # (mem_id, Memory if already loaded) for the fallback, newest first
+
+        for mid, flags in flagged:
+            mem = None
+            if flags is None:
+                # Indexed before flags were stored - inspect the memory itself
+                mem = load_memory(mid)
+                if not mem:
+                    continue
                 obj = mem.find_object(search_entity)
-                if obj and obj.context:
-                    ctx_lower = obj.context.lower()
-                    if any(hint in ctx_lower for hint in IN_HAND_CONTEXTS):
-                        if in_hand_memory is None:
-                            in_hand_memory = mem  # Save for fallback
-                        continue  # Skip "in hand" memories
-                placed_mem_ids.append(mid)
-
-        if placed_mem_ids:
-            mem_ids = placed_mem_ids
-        elif in_hand_memory:
-            # Only "in hand" memories found - return special marker for renderer
-            movements = temporal.get_history(search_entity) if temporal else []
-            return in_hand_memory, ("only_in_hand", movements)
+                flags = object_context_flags(obj.context) if obj else 0
+            if flags & _FLAG_IN_HAND:
+                in_hand.append((mid, mem))
+                continue  # Skip "in hand" memories
+            mem = mem or load_memory(mid)
+            if mem:
+                # Newest placed memory that loads is the answer
+                index.record_access([mid])
+                movements = temporal.get_history(search_entity) if temporal else []
+                return mem, movements
+
+        # Only "in hand" memories found - return special marker for renderer
+        for mid, mem in in_hand:
+            mem = mem or load_memory(mid)
+            if mem:
+                movements = temporal.get_history(search_entity) if temporal else []
+                return mem, ("only_in_hand", movements)
+        # Nothing loadable: fall through (load_memory below reports not found)
 
     if mem_ids:
         index.record_access(mem_ids[:1])
@@ -4284,6 +6320,110 @@ def find_object(index: MemoryIndex, temporal: TemporalGraph,
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def enable_realtime(priority: int) -> None:
+    """
+    Move this process to SCHED_RR and lock its memory (daemon only).
+
+    Round-robin real-time scheduling stops background I/O from preempting
+    the capture loop, and mlockall(MCL_CURRENT | MCL_FUTURE) keeps its
+    pages from being swapped out to microSD. Both need root or
+    CAP_SYS_NICE / CAP_IPC_LOCK; without them we log and carry on with
+    normal scheduling.
+
+    Args:
+        priority: SCHED_RR priority (1-99); 0 or less does nothing
+    """
+    if priority <= 0:
+        return
+    try:
+        os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(priority))
+        log(f"[RT] SCHED_RR priority {priority}")
+    except (AttributeError, OSError) as e:  # Non-Linux / unprivileged
+        log(f"[RT] ⚠️  Could not set SCHED_RR: {e}")
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        MCL_CURRENT, MCL_FUTURE = 1, 2
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        log("[RT] Memory locked (mlockall)")
+    except (AttributeError, OSError) as e:
+        log(f"[RT] ⚠️  Could not lock memory: {e}")
+
+
+class PersistWorker:
+    """
+    Background writer for the daemon's periodic saves.
+
+    Writing the index and temporal graph (and pruning old memories) can
+    stall for hundreds of ms on a microSD card. The capture loop hands
+    that work to this thread through a small queue and goes straight back
+    to capturing. Back-to-back requests are coalesced into one write, and
+    a request made while the queue is full is dropped - the pending write
+    will include that state anyway.
+
+    The index and graph are shared with the capture loop, so both sides
+    hold `lock` while touching them - this thread only to snapshot them
+    and to detach forgotten memories, never across a disk write.
+    """
+
+    _PERSIST = object()  # Queue item: write index + graph, prune old memories
+    _STOP = object()     # Queue item: exit the thread
+
+    def __init__(self, index: 'MemoryIndex', temporal: TemporalGraph,
+                 lock: threading.Lock):
+        self.index = index
+        self.temporal = temporal
+        self.lock = lock
+        self._queue: queue.Queue = queue.Queue(maxsize=2)
+        self._thread = threading.Thread(target=self._run, name="gem-persist", daemon=True)
+        self._thread.start()
+
+    def request(self):
+        """Ask for a save without blocking the caller."""
+        try:
+            self._queue.put_nowait(self._PERSIST)
+        except queue.Full:
+            pass  # A save is already queued and will cover this one
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the thread, waiting up to `timeout` seconds for a running save."""
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            # Take everything queued so far and handle it as one request
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self._STOP in items:
+                return  # Caller does the final save itself on shutdown
+
+            try:
+                # Only the in-memory snapshot needs the lock; the fsync'd
+                # writes run after it's released, so a capture finishing
+                # meanwhile isn't held up by the microSD
+                with self.lock:
+                    index_text = self.index.snapshot()
+                    graph_snapshot = self.temporal.snapshot()
+                save_concurrently(
+                    lambda: self.index.write_snapshot(index_text),
+                    lambda: TemporalGraph.write_snapshot(DATA_DIR / "temporal_graph.json",
+                                                         graph_snapshot),
+                )
+                cleanup_old_memories(self.index, self.lock)
+                log(f"[SAVE] Persisted index and temporal graph")
+            except Exception as e:
+                log_error(f"Background save failed: {e}")
+
+
 def cmd_daemon(headless: bool = False):
     """
     Run the Marathon Agent capture daemon.
@@ -4308,12 +6448,11 @@ def cmd_daemon(headless: bool = False):
     - Self-correcting (re-analyzes on scene changes)
     """
     init_storage()
+    enable_realtime(RT_PRIORITY)
     
     print()
-    log("=" * 60)
-    log("  GEM Marathon Agent (Gemini 3)")
-    log("  Episodic memory for Pi Zero 2W")
-    log("=" * 60)
+    log_banner("  GEM Marathon Agent (Gemini 3)",
+               "  Episodic memory for Pi Zero 2W")
 
     # Initialize Gemini client
     try:
@@ -4355,6 +6494,17 @@ def cmd_daemon(headless: bool = False):
     last_analyze = 0
     captures_this_session = 0
 
+    # Periodic saves run on a background thread; index/graph access from
+    # this loop and from that thread is serialized by persist_lock
+    persist_lock = threading.Lock()
+    persist_worker = PersistWorker(index, temporal, persist_lock)
+
+    # Frame cadence is scheduled against fixed deadlines (start + n*interval)
+    # rather than sleeping a full interval after each frame, so a slow
+    # Gemini call doesn't stretch every following interval too.
+    loop_start = time.monotonic()
+    tick = 0
+
     try:
         while True:
             # Capture frame
@@ -4409,7 +6559,8 @@ def cmd_daemon(headless: bool = False):
                 # Pass the actual capture time, not when Gemini finishes analyzing
                 capture_time = datetime.fromtimestamp(now)
                 memory, was_saved = analyze_and_store(
-                    gemini, index, temporal, jpeg, capture_time, audio_data
+                    gemini, index, temporal, jpeg, capture_time, audio_data,
+                    lock=persist_lock
                 )
                 last_analyze = now
 
@@ -4421,12 +6572,10 @@ def cmd_daemon(headless: bool = False):
                     captures_this_session += 1
 
                     # Periodic save: persist index and graph every 10 captures
-                    # This reduces microSD I/O while ensuring data isn't lost
+                    # This reduces microSD I/O while ensuring data isn't lost.
+                    # The write happens on the persist thread, not here.
                     if captures_this_session % 10 == 0:
-                        index.save()
-                        temporal.save(DATA_DIR / "temporal_graph.json")
-                        cleanup_old_memories(index)
-                        log(f"[SAVE] Persisted index and temporal graph")
+                        persist_worker.request()
 
                     # Visual feedback: green LED when done
                     if hat and hat.board:
@@ -4438,7 +6587,16 @@ def cmd_daemon(headless: bool = False):
                         )
 
             prev_frame = frame
-            time.sleep(CAPTURE_INTERVAL)
+
+            # Sleep until the next deadline. If analysis overran one or more
+            # intervals, skip the missed ticks instead of capturing a burst.
+            tick += 1
+            sleep_for = loop_start + tick * CAPTURE_INTERVAL - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                log(f"[DRIFT] behind by {-sleep_for:.1f}s")
+                tick = int((time.monotonic() - loop_start) / CAPTURE_INTERVAL)
 
     except KeyboardInterrupt:
         # Graceful shutdown on Ctrl+C
@@ -4448,9 +6606,13 @@ def cmd_daemon(headless: bool = False):
         log(f"   Total objects: {len(temporal.last_seen)}")
         log(f"   Total movements: {temporal.total_movements}")
     finally:
-        # Persist all data on shutdown
-        index.save()
-        temporal.save(DATA_DIR / "temporal_graph.json")
+        # Persist all data on shutdown (after any background save finishes)
+        persist_worker.stop()
+        with persist_lock:
+            save_concurrently(
+                index.save,
+                lambda: temporal.save(DATA_DIR / "temporal_graph.json"),
+            )
         camera.close()
         if hat:
             hat.cleanup()
@@ -4473,10 +6635,8 @@ def cmd_search():
     init_storage()
 
     print()
-    log("=" * 60)
-    log("  GEM Search (Gemini 3)")
-    log("  Object + Scene + Time + Co-occurrence")
-    log("=" * 60)
+    log_banner("  GEM Search (Gemini 3)",
+               "  Object + Scene + Time + Co-occurrence")
 
     # Initialize Gemini client
     try:
@@ -4510,8 +6670,10 @@ def cmd_search():
     if hat.board:
         hat.display_text("Ready!\n\nGEM Search", color=(100, 200, 255))
 
-    last_voice_time = 0  # Cooldown timer to prevent double-triggers
     VOICE_COOLDOWN = 2.0  # Minimum seconds between voice triggers
+    # Cooldown timer to prevent double-triggers. Monotonic clock: the Pi
+    # has no RTC, so wall time can jump when NTP syncs after boot.
+    last_voice_time = time.monotonic() - VOICE_COOLDOWN
 
     try:
         while True:
@@ -4519,27 +6681,27 @@ def cmd_search():
             # Voice path: button pressed → record audio → transcribe via Gemini STT.
             # Keyboard path: type query and press Enter.
             #
-            # Uses non-blocking input check so button press works anytime.
+            # Blocks in select() on stdin and the HAT button pipe, so either
+            # input wakes the loop immediately and idle costs nothing here.
 
             raw_query = None
+            voice_understanding = None  # Set when STT + NLU came from one voice call
 
             if voice:
-                # Non-blocking input loop that checks both keyboard and button
+                # Wait on both keyboard and button (debounced by the watcher thread)
                 print("\n🔍 Search (or press button for voice): ", end="", flush=True)
+                button_fd = hat.button_fd()
 
                 while raw_query is None:
-                    # Check for button press (with debouncing and cooldown)
-                    if hat.button_pressed():
-                        # Debounce: wait for button release before proceeding
-                        while hat.button_pressed():
-                            time.sleep(0.05)
-                        time.sleep(0.1)  # Extra debounce delay
+                    ready = select.select([sys.stdin, button_fd], [], [])[0]
 
+                    # Button press (with cooldown)
+                    if button_fd in ready and hat.take_button_presses():
                         # Cooldown: ignore if triggered too recently
-                        if time.time() - last_voice_time < VOICE_COOLDOWN:
+                        if time.monotonic() - last_voice_time < VOICE_COOLDOWN:
                             continue
 
-                        last_voice_time = time.time()
+                        last_voice_time = time.monotonic()
                         print("\n[VOICE]")
                         if hat.board:
                             hat.display_text("Listening...", color=(255, 100, 100))
@@ -4547,7 +6709,13 @@ def cmd_search():
 
                         audio = hat.record_audio()
                         if audio:
-                            raw_query = gemini.transcribe_audio(audio)
+                            # Transcribe + understand in one round trip; fall
+                            # back to separate STT (NLU runs below) on error
+                            voice_understanding = gemini.understand_voice_query(audio)
+                            if voice_understanding is not None:
+                                raw_query = voice_understanding["query"]
+                            else:
+                                raw_query = gemini.transcribe_audio(audio)
                             if raw_query:
                                 log(f"[VOICE] \"{raw_query}\"")
                             else:
@@ -4563,8 +6731,8 @@ def cmd_search():
                             continue
                         break
 
-                    # Check for keyboard input (non-blocking)
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
+                    # Keyboard input
+                    if sys.stdin in ready:
                         line = sys.stdin.readline()
                         if line:
                             raw_query = line.strip()
@@ -4579,18 +6747,23 @@ def cmd_search():
             if raw_query.lower() in ['quit', 'exit', 'q']:
                 break
 
-            # Reload index to pick up new memories from daemon
-            index.reload()
-            temporal.load(DATA_DIR / "temporal_graph.json")
+            # Reload index and graph to pick up new memories from daemon
+            # (each is skipped when nothing on disk changed since last time)
+            index.reload_if_changed()
+            temporal.load_if_changed(DATA_DIR / "temporal_graph.json")
 
             # Use Gemini 3 NLU to understand the query
             # This replaces hardcoded regex patterns with true language understanding
             if hat.board:
-                hat.display_text(f"Understanding:\n{raw_query[:30]}", color=(255, 255, 0))
+                hat.display_text(f"Understanding:\n{_truncate(raw_query, 30)}", color=(255, 255, 0))
                 hat.board.set_rgb(255, 255, 0)
 
             # Gemini understands: query type, entity, and time range (if any)
-            understanding = gemini.understand_query(raw_query)
+            # (already done for voice queries answered by understand_voice_query)
+            if voice_understanding and voice_understanding["query"] == raw_query:
+                understanding = voice_understanding
+            else:
+                understanding = gemini.understand_query(raw_query)
             query_type = understanding["type"]
             entity = understanding["entity"]
             time_start = understanding.get("time_start")
@@ -4609,13 +6782,12 @@ def cmd_search():
 
             # For time queries, use Gemini-parsed time range directly
             if query_type == "time" and time_start and time_end:
-                start = datetime.fromisoformat(time_start)
-                end = datetime.fromisoformat(time_end)
-                mem_ids = index.find_by_time(start, end)
+                start_ns = epoch_ns(datetime.fromisoformat(time_start).timestamp())
+                end_ns = epoch_ns(datetime.fromisoformat(time_end).timestamp())
+                mem_ids = index.find_by_time_ns(start_ns, end_ns)
                 if mem_ids:
                     index.record_access(mem_ids[:5])
-                memories = [load_memory(mid) for mid in mem_ids[:10]]
-                result = [m for m in memories if m is not None]
+                result = _take_valid(mem_ids, 10)
                 extra = []
             else:
                 result, extra = find_object(
@@ -4656,7 +6828,7 @@ def cmd_search():
 
                     if hat.board:
                         # Show abbreviated narrative on LCD
-                        short_narrative = narrative[:80] + "..." if len(narrative) > 80 else narrative
+                        short_narrative = _truncate(narrative, 80)
                         hat.display_text(
                             f"{entity}:\n\n{short_narrative}",
                             color=(100, 200, 255)
@@ -4664,7 +6836,7 @@ def cmd_search():
                         hat.board.set_rgb(0, 255, 0)
 
                     # TTS: Speak the activity summary
-                    hat.speak(narrative, gemini=gemini, for_search=True)
+                    hat.speak_stream(narrative, gemini=gemini, for_search=True)
                 else:
                     log(f"[TIME] No memories from '{entity}'")
                     if hat.board:
@@ -4682,12 +6854,10 @@ def cmd_search():
                     log(f"[NEAR] Objects seen with '{entity}':")
                     # Deduplicate co-occurring objects across multiple memories
                     # using lowercase key → original case value to preserve display
-                    seen_with = {}
-                    for mem_id, others in cooccurrences[:5]:
-                        for o in others:
-                            seen_with[o.lower()] = o
+                    # (one dict comprehension; a later spelling wins, as before)
+                    seen_with = {o.lower(): o for _, others in cooccurrences[:5] for o in others}
                     if seen_with:
-                        for obj_name in list(seen_with.values())[:10]:
+                        for obj_name in islice(seen_with.values(), 10):
                             log(f"   📦 {obj_name}")
                     else:
                         log(f"   (no co-occurring objects found)")
@@ -4698,7 +6868,7 @@ def cmd_search():
                         log(f"   🕐 {memory.timestamp[:16]}")
 
                     if hat.board:
-                        items = ", ".join(list(seen_with.values())[:3])
+                        items = ", ".join(islice(seen_with.values(), 3))
                         hat.display_text(
                             f"Near {entity}:\n{items}",
                             color=(100, 255, 200)
@@ -4727,15 +6897,19 @@ def cmd_search():
                 people = extra if isinstance(extra, list) else []
 
                 # Also collect visual persons from memories
+                # (name/description sets built once, not per visual person)
+                people_set = set(people)
+                people_lower = {p.lower() for p in people}
                 visual_persons = []
+                add_visual = visual_persons.append
                 for mem in memories:
-                    for vp in getattr(mem, 'persons', []):
+                    for vp in mem.persons:
                         desc = vp.get('description', '')
                         name = vp.get('name', '')
-                        if name and name not in people:
-                            visual_persons.append(f"{name} ({desc})")
-                        elif desc and desc not in [p.lower() for p in people]:
-                            visual_persons.append(desc)
+                        if name and name not in people_set:
+                            add_visual(f"{name} ({desc})")
+                        elif desc and desc not in people_lower:
+                            add_visual(desc)
 
                 has_people = people or visual_persons
 
@@ -4762,11 +6936,13 @@ def cmd_search():
                             log(f"      📍 {mem.location} @ {mem.timestamp[:16]}")
 
                     if hat.board:
-                        # Combine audio names and visual descriptions for display
-                        all_people = people + visual_persons[:3]
-                        people_str = ", ".join(all_people[:3])
-                        if len(all_people) > 3:
-                            people_str += f" +{len(all_people)-3}"
+                        # Combine audio names and (up to 3) visual descriptions
+                        # for display, without building the combined list
+                        people_parts = [", ".join(islice(chain(people, visual_persons), 3))]
+                        total_people = len(people) + min(len(visual_persons), 3)
+                        if total_people > 3:
+                            people_parts.append(f"+{total_people-3}")
+                        people_str = " ".join(people_parts)
                         hat.display_text(
                             f"People:\n\n{people_str}",
                             color=(200, 150, 255)
@@ -4777,7 +6953,7 @@ def cmd_search():
                     speech_people = people if people else visual_persons[:3]
                     if speech_people:
                         speech = f"You saw {', '.join(speech_people[:3])}"
-                        hat.speak(speech, gemini=gemini, for_search=True)
+                        hat.speak_stream(speech, gemini=gemini, for_search=True)
                 else:
                     if entity:
                         log(f"[WHO] No memory of meeting '{entity}'")
@@ -4823,14 +6999,14 @@ def cmd_search():
                     # TTS: Confirm the activity
                     if activities and memories:
                         speech = f"Yes, I saw {activities[0]} at {memories[0].timestamp[11:16]}"
-                        hat.speak(speech, gemini=gemini, for_search=True)
+                        hat.speak_stream(speech, gemini=gemini, for_search=True)
                 else:
                     log(f"[NO] No memory of '{entity}'")
                     if hat.board:
                         hat.display_text(f"No memory of:\n\n{entity}", color=(255, 100, 100))
                         hat.board.set_rgb(255, 0, 0)
                     # TTS: Say we didn't see it
-                    hat.speak(f"I don't have a memory of {entity}", gemini=gemini, for_search=True)
+                    hat.speak_stream(f"I don't have a memory of {entity}", gemini=gemini, for_search=True)
 
             # --- RENDERER 2.9: VQA QUERY (Visual Question Answering) ---
             # Shows the answer to a visual question about an object.
@@ -4849,20 +7025,20 @@ def cmd_search():
                     if hat.board:
                         # Show the answer prominently
                         hat.display_text(
-                            f"Answer:\n\n{vqa_answer[:60]}",
+                            f"Answer:\n\n{_truncate(vqa_answer, 60)}",
                             color=(150, 200, 255)
                         )
                         hat.board.set_rgb(0, 255, 0)
 
                     # TTS: Speak the answer
-                    hat.speak(vqa_answer, gemini=gemini, for_search=True)
+                    hat.speak_stream(vqa_answer, gemini=gemini, for_search=True)
                 else:
                     error_msg = vqa_answer if vqa_answer else f"Could not find '{entity}' in memory"
                     log(f"[VQA] {error_msg}")
                     if hat.board:
                         hat.display_text(f"Not found:\n\n{entity}", color=(255, 100, 100))
                         hat.board.set_rgb(255, 0, 0)
-                    hat.speak(error_msg, gemini=gemini, for_search=True)
+                    hat.speak_stream(error_msg, gemini=gemini, for_search=True)
 
             # --- RENDERER 2.95: "ONLY IN HAND" FALLBACK ---
             # When user asks "where did I LEAVE X?" but we only have memories
@@ -4895,7 +7071,7 @@ def cmd_search():
 
                 # TTS: Helpful message
                 speech = f"I saw you holding your {entity} at {memory.location}, but I haven't seen you put it down yet."
-                hat.speak(speech, gemini=gemini, for_search=True)
+                hat.speak_stream(speech, gemini=gemini, for_search=True)
 
             # --- RENDERER 3: OBJECT / SCENE QUERY (core episodic recall) ---
             # Shows: location, position, timestamp, context, movement history,
@@ -4906,6 +7082,18 @@ def cmd_search():
                 movements = extra  # type: ignore
                 obj = memory.find_object(entity)
 
+                # Draw bounding boxes on the memory image: green for the searched
+                # object, blue for others. Include location and movement info as
+                # text banner at bottom. The PIL decode/draw/encode doesn't depend
+                # on anything below, so start it now on the I/O pool and let it
+                # run behind the LCD pause and the Gemini narrative round-trip.
+                info_lines = [f"Location: {memory.location}", f"Position: {obj.position() if obj else '?'}"]
+                if movements:
+                    # Add most recent movement
+                    info_lines.append(movements[0].to_narrative())
+                info_text = "\n".join(info_lines)
+                annotated_future = _io_pool().submit(annotate_image, memory, entity, info_text)
+
                 print()
                 log(f"[FOUND!]")
                 log(f"   📍 {memory.location}")
@@ -4943,16 +7131,9 @@ def cmd_search():
                     )
                     log(f"[NARRATIVE] {narrative}")
 
-                # Draw bounding boxes on the memory image: green for the searched
-                # object, blue for others. Save annotated JPEG to result.jpg
-                # (overwritten each search) and display on HAT LCD if available.
-                # Include location and movement info as text banner at bottom.
-                info_lines = [f"Location: {memory.location}", f"Position: {obj.position() if obj else '?'}"]
-                if movements:
-                    # Add most recent movement
-                    info_lines.append(movements[0].to_narrative())
-                info_text = "\n".join(info_lines)
-                annotated = annotate_image(memory, entity, info_text)
+                # Save annotated JPEG to result.jpg (overwritten each search)
+                # and display on HAT LCD if available.
+                annotated = annotated_future.result()
                 if annotated:
                     path = MEMORY_DIR / "result.jpg"
                     path.write_bytes(annotated)
@@ -4966,12 +7147,13 @@ def cmd_search():
                         hat.board.set_rgb(0, 255, 0)
 
                     # TTS: Speak result (in addition to LCD display)
-                    speech = f"Found your {entity} on the {memory.location}"
+                    speech_parts = [f"Found your {entity} on the {memory.location}"]
                     if obj and obj.context:
-                        speech += f", {obj.context}"
-                    hat.speak(speech, gemini=gemini, for_search=True)
+                        speech_parts.append(obj.context)
+                    speech = ", ".join(speech_parts)
+                    hat.speak_stream(speech, gemini=gemini, for_search=True)
                 else:
-                    log(f"   ⚠️  No image data (image_data={len(memory.image_data) if memory.image_data else 0} bytes)")
+                    log(f"   ⚠️  No image data (image_data={memory.image_size()} bytes)")
 
             # --- RENDERER 4: NOT FOUND ---
             else:
@@ -4986,7 +7168,7 @@ def cmd_search():
                         hat.display_text(f"Not found:\n{entity}\n\nLast: on you\n{last_time[11:16]}", color=(255, 150, 50))
                         hat.board.set_rgb(255, 100, 0)
                     # TTS for attached object
-                    hat.speak(f"I haven't seen your {entity} recently. Last seen on you at {last_time[11:16]}", gemini=gemini, for_search=True)
+                    hat.speak_stream(f"I haven't seen your {entity} recently. Last seen on you at {last_time[11:16]}", gemini=gemini, for_search=True)
                 else:
                     # Use Gemini's world knowledge to suggest where to look
                     # This is smarter than hardcoded suggestions - Gemini knows
@@ -5005,32 +7187,25 @@ def cmd_search():
                             hat.board.set_rgb(255, 150, 0)
 
                         # TTS: Speak suggestion
-                        hat.speak(f"I haven't seen your {entity}. Try looking {top_suggestion}", gemini=gemini, for_search=True)
+                        hat.speak_stream(f"I haven't seen your {entity}. Try looking {top_suggestion}", gemini=gemini, for_search=True)
                     else:
                         if hat.board:
                             hat.display_text(f"Not found:\n{entity}", color=(255, 100, 100))
                             hat.board.set_rgb(255, 0, 0)
                         # TTS for not found
-                        hat.speak(f"I haven't seen your {entity}", gemini=gemini, for_search=True)
+                        hat.speak_stream(f"I haven't seen your {entity}", gemini=gemini, for_search=True)
 
-            # Persist access_log after each query so retrieval reinforcement
-            # data survives crashes (important on battery-powered wearable)
-            index.save()
+            # Persist access hits after each query so retrieval reinforcement
+            # data survives crashes (important on battery-powered wearable).
+            # Appends a journal line; queries that hit nothing write nothing.
+            index.save_access()
 
             # Wait for button press to dismiss results (or timeout after 30s)
             # This gives user time to view the result on the LCD
             if hat.board:
                 log("   (Press button to continue)")
-                wait_start = time.time()
-                while time.time() - wait_start < 30:  # 30 second timeout
-                    if hat.button_pressed():
-                        # Debounce: wait for button release
-                        while hat.button_pressed():
-                            time.sleep(0.05)
-                        time.sleep(0.2)  # Extra delay to prevent triggering next voice input
-                        last_voice_time = time.time()  # Reset cooldown
-                        break
-                    time.sleep(0.1)
+                if hat.wait_for_button(timeout=30):  # 30 second timeout
+                    last_voice_time = time.monotonic()  # Reset cooldown (no instant voice retrigger)
                 hat.display_text("Ready!\n\nGEM Search", color=(100, 200, 255))
                 hat.board.set_rgb(0, 100, 255)
             else:
@@ -5044,6 +7219,36 @@ def cmd_search():
         hat.cleanup()
 
 
+def _format_list_entry(name: str, data) -> str | None:
+    """
+    One memory's block for `gem.py list`.
+
+    Args:
+        name: Memory JSON file name (mem_YYYYMMDD_HHMMSS.json)
+        data: Parsed file contents, or None if it couldn't be read
+
+    Returns:
+        Printable block (each line newline-terminated), or None for a
+        missing or malformed file
+    """
+    if not isinstance(data, dict):
+        return None
+    try:
+        mem_id = data.get("id", name[:-len(".json")])
+        objs = data.get("objects")
+        lines = [
+            f"\n  {mem_id}\n",
+            f"    📍 {data.get('location', '?')}\n",
+            f"    📦 {', '.join(o.get('name', '?') for o in objs[:4]) if objs else ''}\n",
+        ]
+        if tags := data.get("tags"):
+            lines.append(f"    🏷️  {', '.join(tags[:3])}\n")
+        lines.append(f"    🕐 {data.get('timestamp', '')[:16]}\n")
+        return "".join(lines)
+    except Exception:
+        return None  # Unexpected field types (hand-edited file)
+
+
 def cmd_list():
     """
     List stored memories with temporal statistics.
@@ -5052,63 +7257,91 @@ def cmd_list():
     """
     init_storage()
 
-    # Get all memory files (exclude memory_index.json)
-    files = sorted(MEMORY_DIR.glob("mem_*.json"), reverse=True)
+    # Get all memory file names (exclude memory_index.json) in one readdir
+    # pass - no Path objects or per-file stat. Names sort chronologically
+    # (mem_YYYYMMDD_HHMMSS), so the newest 20 is a heap selection, not a sort.
+    with os.scandir(MEMORY_DIR) as entries:
+        files = [e.name for e in entries if e.name.startswith("mem_") and e.name.endswith(".json")]
+    recent = heapq.nlargest(20, files)
 
-    # Load temporal graph for statistics
-    temporal = TemporalGraph()
-    temporal.load(DATA_DIR / "temporal_graph.json")
+    # Temporal statistics from the graph's summary sidecar (not the full graph)
+    stats = TemporalGraph.load_summary(DATA_DIR / "temporal_graph.json")
 
     if not files:
         log("No memories. Run: python gem.py")
         return
 
     print()
-    log("=" * 60)
-    log(f"  GEM Memory Store")
-    log("=" * 60)
+    log_banner("  GEM Memory Store")
     log(f"📚 {len(files)} memories")
-    log(f"🔄 {temporal.total_movements} object movements tracked")
-    log(f"📦 {len(temporal.last_seen)} unique objects seen")
-    log("=" * 60)
-
-    # Show recent memories (with tags)
-    for path in files[:20]:
-        try:
-            data = json5.loads(path.read_text())
-            mem_id = data.get("id", path.stem)
-            loc = data.get("location", "?")
-            objs = [o.get("name", "?") for o in data.get("objects", [])[:4]]
-            ts = data.get("timestamp", "")[:16]
-            tags = data.get("tags", [])
-
-            print(f"\n  {mem_id}")
-            print(f"    📍 {loc}")
-            print(f"    📦 {', '.join(objs)}")
-            if tags:
-                print(f"    🏷️  {', '.join(tags[:3])}")
-            print(f"    🕐 {ts}")
-        except Exception:
-            pass
+    log(f"🔄 {stats['total_movements']} object movements tracked")
+    log(f"📦 {stats['n_objects']} unique objects seen")
+    log(_BANNER60)
+
+    # Show recent memories (with tags). The files are read in parallel on
+    # the I/O pool: on an SD card each read is mostly waiting, so overlapping
+    # them costs about one file's latency instead of twenty.
+    # The whole block is formatted first and written with one print, so a
+    # slow terminal or SSH session sees one write instead of ~100.
+    recent_data = _io_pool().map(read_json_or_none, [MEMORY_DIR / name for name in recent])
+    entries = filter(None, map(_format_list_entry, recent, recent_data))
+    print("".join(entries), end="")
 
     if len(files) > 20:
         print(f"\n  ... +{len(files) - 20} more")
 
     # Show most active objects
-    if temporal.movements:
+    if stats["top"]:
         print()
         log("Most active objects (by movements):")
-        sorted_objs = sorted(
-            temporal.movements.items(),
-            key=lambda x: len(x[1]),
-            reverse=True
-        )[:5]
-        for obj_name, moves in sorted_objs:
-            print(f"    {obj_name}: {len(moves)} movements")
+        for obj_name, n_moves in stats["top"]:
+            print(f"    {obj_name}: {n_moves} movements")
 
     print()
 
 
+def _hw_test_api_probe(gemini: GeminiClient, api_marker: Path, api_stamp: str) -> tuple[bool, str]:
+    """
+    Network half of cmd_hw_test's Test 1: one minimal streamed request.
+
+    Runs on the I/O pool while the camera and button tests use the
+    hardware. It doesn't log; its single report line is logged by the
+    caller afterwards, so nothing interleaves with the other tests.
+
+    Args:
+        gemini: Client created on the main thread
+        api_marker: File recording the last passing check
+        api_stamp: Model + key fingerprint written to api_marker on success
+
+    Returns:
+        (passed, report line)
+    """
+    try:
+        # Streamed: the first chunk with text proves the round-trip, so
+        # stop there instead of waiting for the end of the response.
+        stream = gemini.client.models.generate_content_stream(
+            model=VISION_MODEL,
+            contents="Reply: OK",
+            config=types.GenerateContentConfig(
+                max_output_tokens=5,
+                thinking_config=types.ThinkingConfig(
+                    thinking_level=types.ThinkingLevel.MINIMAL
+                )
+            )
+        )
+        text = next((chunk.text for chunk in stream if chunk.text), "")
+        stream.close()  # Drop the rest of the response
+    except Exception as e:
+        api_marker.unlink(missing_ok=True)
+        return False, f"❌ {e}"
+
+    if text:
+        atomic_write_text(api_marker, api_stamp)
+        return True, f"✅ API responded: {text.strip()}"
+    api_marker.unlink(missing_ok=True)
+    return False, "❌ API returned empty response"
+
+
 def cmd_hw_test():
     """
     Test all hardware components and Gemini connection.
@@ -5118,13 +7351,14 @@ def cmd_hw_test():
     2. Camera capture → LCD display
     3. Button + LED
     4. Microphone → Gemini STT
+
+    Test 1's API round-trip only touches the network, so it runs alongside
+    Tests 2 and 3 and its result is reported just before Test 4.
     """
     init_storage()
     
     print()
-    log("=" * 50)
-    log("  GEM Hardware Test ")
-    log("=" * 50)
+    log_banner("  GEM Hardware Test ", rule=_BANNER50)
     print()
     
     results = {}
@@ -5134,33 +7368,32 @@ def cmd_hw_test():
     log("[TEST 1/4] Gemini 3 API")
     log("-" * 40)
     gemini = None
+    api_future = None
+    # A recent pass for the same model and key is trusted, so checking the
+    # button or mic doesn't wait on a network round-trip every run
+    api_marker = DATA_DIR / "api_check_ok"
+    api_stamp = f"{VISION_MODEL} {hashlib.sha256(os.getenv('GEMINI_API_KEY', '').encode()).hexdigest()[:16]}"
     try:
+        # Created here, not on the pool, so its own log lines land in Test 1
         gemini = GeminiClient()
         log("   ✅ Client initialized")
 
-        # Actually test the API with a real call (optimized for speed)
-        log("   Testing API connection...")
-        response = gemini.client.models.generate_content(
-            model=VISION_MODEL,
-            contents="Reply: OK",
-            config=types.GenerateContentConfig(
-                max_output_tokens=5,
-                thinking_config=types.ThinkingConfig(
-                    thinking_level=types.ThinkingLevel.MINIMAL
-                )
-            )
-        )
-
-        if response and response.text:
+        if (not FORCE_API_CHECK
+                and time.time_ns() - mtime_ns(api_marker) < API_CHECK_TTL * 1_000_000_000
+                and api_marker.read_text() == api_stamp):
             results["gemini"] = True
-            log(f"   ✅ API responded: {response.text.strip()}")
+            log(f"   ✅ API OK (checked in the last {API_CHECK_TTL // 60} min; "
+                "GEM_FORCE_API_CHECK=1 to re-check)")
         else:
-            results["gemini"] = False
-            log("   ❌ API returned empty response")
+            # Actually test the API with a real call. It has no dependency
+            # on the hardware, so it runs while Tests 2 and 3 go ahead.
+            log("   Testing API connection (result after Test 3)...")
+            api_future = _io_pool().submit(_hw_test_api_probe, gemini, api_marker, api_stamp)
 
     except Exception as e:
         results["gemini"] = False
         log(f"   ❌ {e}")
+        api_marker.unlink(missing_ok=True)
 
     print()
     
@@ -5192,7 +7425,8 @@ def cmd_hw_test():
         log(f"   ❌ {e}")
 
     print()
-    time.sleep(2)
+    if hat.board:
+        time.sleep(2)  # Leave the test photo on the LCD for a moment
 
 
     # Test 3: Button + LED
@@ -5203,17 +7437,21 @@ def cmd_hw_test():
         log("   🔘 Waiting 5s...")
         
         pressed = False
-        start = time.time()
         flash = False
-        
-        while time.time() - start < 5:
-            if hat.button_pressed():
-                pressed = True
-                break
 
+        # Flash the LED every 150ms until a press or the 5s deadline. Each
+        # wait blocks on the button fd for what's left of the interval, so
+        # a press ends it at once and timing doesn't drift with the flashes.
+        button_fd = hat.button_fd()
+        hat.take_button_presses()
+        deadline = time.monotonic_ns() + 5_000_000_000
+        while (remaining := deadline - time.monotonic_ns()) > 0:
             flash = not flash
             hat.board.set_rgb(255, 255, 0) if flash else hat.board.set_rgb(0, 0, 0)
-            time.sleep(0.15)
+            ready = select.select([button_fd], [], [], min(remaining, 150_000_000) / 1e9)[0]
+            if ready and hat.take_button_presses():
+                pressed = True
+                break
         
         if pressed:
             hat.board.set_rgb(0, 255, 0)
@@ -5228,7 +7466,15 @@ def cmd_hw_test():
         log("   ⚠️  HAT not available")
     
     print()
-    time.sleep(1)
+    if hat.board:
+        time.sleep(1)
+
+
+    # Background API check from Test 1
+    if api_future is not None:
+        results["gemini"], report = api_future.result()
+        log(f"[API] {report}")
+        print()
 
 
     # Test 4: Mic → Gemini STT (+ Speaker if TTS enabled)
@@ -5240,7 +7486,7 @@ def cmd_hw_test():
         if hat.board:
             hat.display_text("Recording\n3s...\n\nSpeak!", color=(255, 100, 100))
 
-        audio = hat.record_audio(3)
+        audio = hat.record_audio(3, stop_on_silence=True)
 
         if audio and len(audio) > 10000:
             path = MEMORY_DIR / "test_audio.wav"
@@ -5250,15 +7496,12 @@ def cmd_hw_test():
             # Test speaker: playback the recording (only if TTS enabled)
             if TTS_ENABLED:
                 if hat.board:
-                    hat.display_text("Playing back...\n\n(Speaker test)", color=(255, 200, 100))
-                    hat.board.set_rgb(0, 0, 255)  # Blue during playback
+                    hat.display_text("Playing back...\n\n(Speaker test)", color=(255, 200, 100),
+                                     led=(0, 0, 255))  # Blue during playback
 
                 log("   🔊 Playing back recording...")
                 try:
-                    subprocess.run(
-                        ["aplay", "-D", "plughw:0,0", "-q", str(path)],
-                        timeout=10, capture_output=True
-                    )
+                    play_wav_bytes(audio, blocking=True, timeout=10)
                     log("   ✅ Speaker playback OK")
                     results["speaker"] = True
                 except Exception as e:
@@ -5269,10 +7512,16 @@ def cmd_hw_test():
                 results["speaker"] = True  # Mark as passed (not applicable)
 
             if hat.board:
-                hat.display_text("Transcribing...", color=(100, 200, 255))
-                hat.board.set_rgb(255, 255, 255)  # White during transcription
+                hat.display_text("Transcribing...", color=(100, 200, 255),
+                                 led=(255, 255, 255))  # White during transcription
 
-            transcript = gemini.transcribe_audio(audio)
+            # A silent clip can't transcribe to anything: skip the API call
+            rms = wav_peak_rms(audio)
+            if rms >= SPEECH_RMS_THRESHOLD:
+                transcript = gemini.transcribe_audio(audio)
+            else:
+                transcript = ""
+                log(f"   ⚠️  Only silence recorded (RMS {rms:.0f})")
 
             if transcript:
                 results["mic_stt"] = True
@@ -5302,9 +7551,7 @@ def cmd_hw_test():
     passed = sum(results.values())
     total = len(results)
     
-    log("=" * 50)
-    log(f"  Results: {passed}/{total} passed")
-    log("=" * 50)
+    log_banner(f"  Results: {passed}/{total} passed", rule=_BANNER50)
     
     if hat.board:
         time.sleep(2)
@@ -5319,6 +7566,21 @@ def cmd_hw_test():
 # SECTION 13: MAIN ENTRY POINT
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Command name -> entry point. One dict lookup replaces the if-chain;
+# anything not listed (including no argument) runs the capture daemon.
+COMMANDS: dict[str, Callable[[], None]] = {
+    "list": cmd_list,
+    "hw_test": cmd_hw_test,
+    "test": cmd_hw_test,  # hw_test preferred, test for backwards compat
+    "search": cmd_search,
+    # Run daemon without HAT (allows search to use LCD/mic)
+    "--headless": lambda: cmd_daemon(headless=True),
+    "headless": lambda: cmd_daemon(headless=True),
+    "-H": lambda: cmd_daemon(headless=True),
+}
+HELP_FLAGS = frozenset(("-h", "--help", "help"))
+
+
 def main():
     """
     Main entry point - parse command and run.
@@ -5328,34 +7590,21 @@ def main():
         search    - Interactive search mode
         list      - List stored memories
         test      - Test hardware components
+        --headless - Run capture daemon without the HAT
         --help    - Show documentation
     """
-    if len(sys.argv) >= 2:
-        cmd = sys.argv[1].lower()
-        
-        if cmd in ["-h", "--help", "help"]:
+    cmd = sys.argv[1] if len(sys.argv) >= 2 else ""
+
+    # Exact match first so "-H" isn't lowered into "-h" (help);
+    # the lower() fallback keeps "LIST", "Search" etc. working
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        cmd = cmd.lower()
+        if cmd in HELP_FLAGS:
             print(__doc__)
             return
-        
-        if cmd == "list":
-            cmd_list()
-            return
-        
-        if cmd in ["hw_test", "test"]:  # hw_test preferred, test for backwards compat
-            cmd_hw_test()
-            return
-        
-        if cmd == "search":
-            cmd_search()
-            return
-
-        if cmd in ["--headless", "headless", "-H"]:
-            # Run daemon without HAT (allows search to use LCD/mic)
-            cmd_daemon(headless=True)
-            return
-
-    # Default: run capture daemon with HAT
-    cmd_daemon(headless=False)
+        handler = COMMANDS.get(cmd, lambda: cmd_daemon(headless=False))
+    handler()
 
 
 if __name__ == "__main__":